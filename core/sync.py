@@ -2,13 +2,197 @@ import json
 import os
 from pathlib import Path
 from datetime import datetime
+import asyncio
 import hashlib
+import random
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from slugify import slugify
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from ..utils.console import print_info, print_success, print_error, print_warning
 from ..utils.helpers import extract_front_matter
 from .notion_client import NotionClient
 
+# Read size used when hashing files so memory stays bounded for large notes
+HASH_CHUNK_SIZE = 1 << 20
+
+# Maximum number of Notion API requests in flight at once
+MAX_API_WORKERS = 8
+
+# Retry settings for rate-limited (429) and server error (5xx) responses
+MAX_API_RETRIES = 5
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Statuses retried for calls that create something; a 5xx may arrive after Notion applied the request
+NON_IDEMPOTENT_RETRYABLE_STATUS_CODES = {429}
+
+# Commits and content objects are zstd-compressed when zstandard is installed
+ZSTD_LEVEL = 3
+ZSTD_SUFFIX = ".zst"
+
+
+def dumps_json(data, indent=False):
+    """Serialize data to JSON bytes, using orjson when it is installed
+    
+    Args:
+        data: JSON-serializable data
+        indent (bool): Pretty-print with two-space indentation
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(data):
+    """Parse JSON bytes or text, using orjson when it is installed
+    
+    Args:
+        data (bytes or str): JSON document
+        
+    Returns:
+        The parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def compress_data(data):
+    """Compress data with zstd when zstandard is installed
+    
+    Args:
+        data (bytes): Data to compress
+        
+    Returns:
+        tuple: (data, suffix) where suffix is ".zst" if the data was compressed
+    """
+    if zstandard is None:
+        return data, ""
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data), ZSTD_SUFFIX
+
+
+def read_file_data(path):
+    """Read a file's bytes, decompressing it if its name ends in .zst
+    
+    Args:
+        path (str or Path): File to read
+        
+    Returns:
+        bytes: The (decompressed) file content
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if str(path).endswith(ZSTD_SUFFIX):
+        if zstandard is None:
+            raise RuntimeError(
+                f"{path} is zstd-compressed but the zstandard package is not installed; "
+                "install it with: pip install notionsync[zstd]"
+            )
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+
+def find_object_path(objects_dir, file_hash):
+    """Find the stored object for a content hash
+    
+    Args:
+        objects_dir (Path): Directory holding content objects
+        file_hash (str): Content hash
+        
+    Returns:
+        Path: Path of the object, compressed or not, or None if it is not stored
+    """
+    for name in (f"{file_hash}.md{ZSTD_SUFFIX}", f"{file_hash}.md"):
+        object_path = objects_dir / name
+        if object_path.exists():
+            return object_path
+    return None
+
+
+def write_file_atomic(path, data):
+    """Write bytes to a file through a temporary file and os.replace
+    
+    Readers never observe a partially written file, even if the process is
+    interrupted mid-write.
+    
+    Args:
+        path (str or Path): Destination path
+        data (bytes): Content to write
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=1024)
+def _extract_front_matter_cached(content):
+    """Memoized extract_front_matter; callers must copy the returned dict"""
+    return extract_front_matter(content)
+
+
+def parse_front_matter(content):
+    """Extract front matter from markdown content, reusing earlier parses within a run
+    
+    Args:
+        content (str): Markdown content
+        
+    Returns:
+        tuple: (front_matter, content) where front_matter is a fresh dict
+    """
+    front_matter, markdown_content = _extract_front_matter_cached(content)
+    return dict(front_matter), markdown_content
+
+
+class CommitContents(Mapping):
+    """Read-only mapping of file paths to their committed content
+    
+    Contents are read from the object store on first access, so looking up
+    one deleted file does not load every file in the commit.
+    """
+
+    def __init__(self, files, objects_dir):
+        """Initialize CommitContents
+
+        Args:
+            files (dict): Dictionary of file paths to their hash
+            objects_dir (Path): Directory holding content objects named by hash
+        """
+        self._files = files
+        self._objects_dir = objects_dir
+        self._cache = {}
+
+    def __getitem__(self, file_path):
+        if file_path not in self._cache:
+            file_hash = self._files[file_path]
+            object_path = find_object_path(self._objects_dir, file_hash)
+            if object_path is None:
+                raise KeyError(file_path)
+            self._cache[file_path] = read_file_data(object_path).decode("utf-8")
+        return self._cache[file_path]
+
+    def __iter__(self):
+        return iter(self._files)
+
+    def __len__(self):
+        return len(self._files)
+
 
 class NotionSync:
     """Main class for syncing between Notion and local markdown files"""
@@ -32,6 +216,27 @@ class NotionSync:
         # Create commits directory if it doesn't exist
         self.commits_dir = self.config_dir / "commits"
         self.commits_dir.mkdir(exist_ok=True)
+        
+        # Content-addressed store of file contents shared by all commits
+        self.objects_dir = self.config_dir / "objects"
+        self.objects_dir.mkdir(exist_ok=True)
+        
+        # Sidecar cache of file hashes keyed by path, mtime and size
+        self.hash_cache_path = self.config_dir / "hash_cache.json"
+        
+        # Front matter of committed files keyed by path, with the content hash it was parsed from
+        self.front_matter_index_path = self.config_dir / "frontmatter.json"
+        self._front_matter_index = None
+        
+        # Time of the last successful pull per database
+        self.last_pull_path = self.config_dir / "last_pull.json"
+        
+        # Pointer to the latest commit file
+        self.head_path = self.config_dir / "HEAD"
+        
+        # Latest commit, loaded on first use and replaced by _save_commit
+        self._last_commit_cache = None
+        self._last_commit_contents = None
 
     def push(self):
         """Push local changes to Notion
@@ -63,9 +268,13 @@ class NotionSync:
             print_error("No page_id or database_id provided")
             return False
 
-    def status(self):
+    def status(self, current_files=None):
         """Check status of local changes compared to last commit
         
+        Args:
+            current_files (dict, optional): Already scanned file hashes. If None, the
+                working directory is scanned.
+        
         Returns:
             dict: Status information with counts of added, modified, and deleted files
         """
@@ -73,7 +282,8 @@ class NotionSync:
         last_commit = self._get_last_commit()
         
         # Get current files
-        current_files = self._get_current_files()
+        if current_files is None:
+            current_files = self._get_current_files()
         
         # Compare
         if not last_commit:
@@ -85,25 +295,14 @@ class NotionSync:
             }
             return status
         
-        # Find added, modified, and deleted files
-        added = []
-        modified = []
-        deleted = []
-        
-        for file_path, file_hash in current_files.items():
-            if file_path not in last_commit:
-                added.append(file_path)
-            elif last_commit[file_path] != file_hash:
-                modified.append(file_path)
-        
-        for file_path in last_commit:
-            if file_path not in current_files:
-                deleted.append(file_path)
+        # Find added, modified, and deleted files with set operations on the paths
+        current_keys = current_files.keys()
+        last_keys = last_commit.keys()
         
         status = {
-            "added": added,
-            "modified": modified,
-            "deleted": deleted
+            "added": sorted(current_keys - last_keys),
+            "modified": sorted(p for p in current_keys & last_keys if current_files[p] != last_commit[p]),
+            "deleted": sorted(last_keys - current_keys)
         }
         
         return status
@@ -133,103 +332,112 @@ class NotionSync:
                 
             print_info(f"Pushing to Notion page with ID: {page_id}")
             
-            # Get the current status
-            status = self.status()
-            
-            # Check if we have an index.md file for the main page content
-            index_path = Path("index.md")
-            if index_path.exists():
-                with open(index_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+            # Scan the working directory in the background while the main page is updated
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                scan = executor.submit(self._get_current_files)
+                
+                # Check if we have an index.md file for the main page content
+                index_path = Path("index.md")
+                if index_path.exists():
+                    with open(index_path, "r", encoding="utf-8") as f:
+                        content = f.read()
+                        
+                    # Extract front matter if present
+                    front_matter, markdown_content = parse_front_matter(content)
                     
-                # Extract front matter if present
-                front_matter, markdown_content = extract_front_matter(content)
+                    # Update the page with markdown content
+                    success = self.notion_client.update_page(page_id, markdown_content)
+                    if success:
+                        print_success(f"Updated main page content from {index_path}")
+                    else:
+                        print_error(f"Failed to update page with content from {index_path}")
+                        return False
                 
-                # Update the page with markdown content
-                success = self.notion_client.update_page(page_id, markdown_content)
-                if success:
-                    print_success(f"Updated main page content from {index_path}")
-                else:
-                    print_error(f"Failed to update page with content from {index_path}")
-                    return False
+                # Get the current status
+                status = self.status(current_files=scan.result())
             
             # Process other markdown files as child pages
-            for file_path in status["added"] + status["modified"]:
+            updates = []
+            creates = []
+            for file_path in chain(status["added"], status["modified"]):
                 path = Path(file_path)
                 
                 # Skip index.md as it's handled separately
                 if path.name == "index.md":
                     continue
                     
-                # Only process markdown files
-                if path.suffix.lower() != ".md":
-                    continue
-                    
                 with open(path, "r", encoding="utf-8") as f:
                     content = f.read()
                     
                 # Extract front matter
-                front_matter, markdown_content = extract_front_matter(content)
+                front_matter, markdown_content = parse_front_matter(content)
                 
                 # Check if this is a new or existing child page
                 if front_matter and "notion_id" in front_matter:
-                    # Update existing page
-                    child_id = front_matter["notion_id"]
-                    success = self.notion_client.update_page(child_id, markdown_content)
-                    if success:
-                        print_success(f"Updated child page for {path}")
-                    else:
-                        print_error(f"Failed to update child page for {path}")
+                    updates.append((path, front_matter["notion_id"], markdown_content))
                 else:
-                    # Create new child page
                     child_title = front_matter.get("title", path.stem) if front_matter else path.stem
-                    child_id = self.notion_client.create_page(page_id, child_title, markdown_content)
-                    if child_id:
-                        print_success(f"Created new child page for {path}")
-                        
-                        # Update the file with the new notion_id in front matter
-                        if front_matter:
-                            front_matter["notion_id"] = child_id
-                        else:
-                            front_matter = {"notion_id": child_id, "title": child_title}
-                            
-                        with open(path, "w", encoding="utf-8") as f:
-                            f.write("---\n")
-                            f.write(json.dumps(front_matter, indent=2))
-                            f.write("\n---\n\n")
-                            f.write(markdown_content)
+                    creates.append((path, front_matter, child_title, markdown_content))
+            
+            # Update existing child pages concurrently
+            results = self._run_concurrently(
+                lambda item: self.notion_client.update_page(item[1], item[2]),
+                updates
+            )
+            for (path, _, _), (success, error) in zip(updates, results):
+                if success:
+                    print_success(f"Updated child page for {path}")
+                else:
+                    print_error(f"Failed to update child page for {path}" + (f": {error}" if error else ""))
+            
+            # Create new child pages concurrently
+            results = self._run_concurrently(
+                lambda item: self.notion_client.create_page(page_id, item[2], item[3]),
+                creates,
+                idempotent=False
+            )
+            file_updates = []
+            for (path, front_matter, child_title, markdown_content), (child_id, error) in zip(creates, results):
+                if child_id:
+                    print_success(f"Created new child page for {path}")
+                    
+                    # Queue a rewrite of the file with the new notion_id in front matter
+                    if front_matter:
+                        front_matter["notion_id"] = child_id
                     else:
-                        print_error(f"Failed to create child page for {path}")
+                        front_matter = {"notion_id": child_id, "title": child_title}
+                        
+                    file_updates.append((path, front_matter, markdown_content))
+                else:
+                    print_error(f"Failed to create child page for {path}" + (f": {error}" if error else ""))
+            
+            self._write_front_matter_updates(file_updates)
             
             # Handle deleted files if they have a notion_id in front matter
+            # Status only lists markdown files, so no suffix check is needed here
+            last_commit = self._get_last_commit() or {}
+            last_commit_data = self._get_last_commit_data() or {}
+            archives = []
             for file_path in status["deleted"]:
                 path = Path(file_path)
                 
-                # Only process markdown files
-                if path.suffix.lower() != ".md":
-                    continue
-                    
-                # Try to get the last committed version
-                last_commit = self._get_last_commit_data()
-                if not last_commit:
-                    continue
-                    
-                file_content = last_commit.get(str(path))
-                if not file_content:
-                    continue
-                    
-                # Extract front matter
-                front_matter, _ = extract_front_matter(file_content)
+                # Look up the front matter of the last committed version
+                front_matter = self._get_committed_front_matter(file_path, last_commit, last_commit_data)
                 
                 # Check if this file had a notion_id
                 if front_matter and "notion_id" in front_matter:
-                    # Archive the page in Notion
-                    child_id = front_matter["notion_id"]
-                    success = self.notion_client.archive_page(child_id)
-                    if success:
-                        print_success(f"Archived Notion page for deleted file {path}")
-                    else:
-                        print_warning(f"Failed to archive Notion page for deleted file {path}")
+                    archives.append((path, front_matter["notion_id"]))
+            
+            # Archive the pages in Notion concurrently
+            results = self._run_concurrently(
+                lambda item: self.notion_client.archive_page(item[1]),
+                archives
+            )
+            for (path, _), (success, _) in zip(archives, results):
+                if success:
+                    print_success(f"Archived Notion page for deleted file {path}")
+                else:
+                    print_warning(f"Failed to archive Notion page for deleted file {path}")
             
             # Save a new commit
             return self._save_commit()
@@ -259,18 +467,16 @@ class NotionSync:
             status = self.status()
             
             # Process markdown files for database entries
-            for file_path in status["added"] + status["modified"]:
+            updates = []
+            creates = []
+            for file_path in chain(status["added"], status["modified"]):
                 path = Path(file_path)
                 
-                # Only process markdown files
-                if path.suffix.lower() != ".md":
-                    continue
-                    
                 with open(path, "r", encoding="utf-8") as f:
                     content = f.read()
                     
                 # Extract front matter
-                front_matter, markdown_content = extract_front_matter(content)
+                front_matter, markdown_content = parse_front_matter(content)
                 
                 # Skip files without front matter
                 if not front_matter:
@@ -279,65 +485,70 @@ class NotionSync:
                     
                 # Check if this is a new or existing database entry
                 if "notion_id" in front_matter:
-                    # Update existing entry
-                    entry_id = front_matter["notion_id"]
                     properties = front_matter.get("properties", {})
-                    success = self.notion_client.update_database_item(entry_id, properties, markdown_content)
-                    if success:
-                        print_success(f"Updated database entry for {path}")
-                    else:
-                        print_error(f"Failed to update database entry for {path}")
+                    updates.append((path, front_matter["notion_id"], properties, markdown_content))
                 else:
-                    # Create new entry
                     title = front_matter.get("title", path.stem)
                     properties = front_matter.get("properties", {})
                     if not properties:
                         properties = {"Name": {"title": [{"text": {"content": title}}]}}
-                        
-                    entry_id = self.notion_client.create_database_item(database_id, properties, markdown_content)
-                    if entry_id:
-                        print_success(f"Created new database entry for {path}")
-                        
-                        # Update the file with the new notion_id in front matter
-                        front_matter["notion_id"] = entry_id
-                        
-                        with open(path, "w", encoding="utf-8") as f:
-                            f.write("---\n")
-                            f.write(json.dumps(front_matter, indent=2))
-                            f.write("\n---\n\n")
-                            f.write(markdown_content)
-                    else:
-                        print_error(f"Failed to create database entry for {path}")
+                    creates.append((path, front_matter, properties, markdown_content))
+            
+            # Update existing entries concurrently
+            results = self._run_concurrently(
+                lambda item: self.notion_client.update_database_item(item[1], item[2], item[3]),
+                updates
+            )
+            for (path, _, _, _), (success, error) in zip(updates, results):
+                if success:
+                    print_success(f"Updated database entry for {path}")
+                else:
+                    print_error(f"Failed to update database entry for {path}" + (f": {error}" if error else ""))
+            
+            # Create new entries concurrently
+            results = self._run_concurrently(
+                lambda item: self.notion_client.create_database_item(database_id, item[2], item[3]),
+                creates,
+                idempotent=False
+            )
+            file_updates = []
+            for (path, front_matter, _, markdown_content), (entry_id, error) in zip(creates, results):
+                if entry_id:
+                    print_success(f"Created new database entry for {path}")
+                    
+                    # Queue a rewrite of the file with the new notion_id in front matter
+                    front_matter["notion_id"] = entry_id
+                    file_updates.append((path, front_matter, markdown_content))
+                else:
+                    print_error(f"Failed to create database entry for {path}" + (f": {error}" if error else ""))
+            
+            self._write_front_matter_updates(file_updates)
             
             # Handle deleted files if they have a notion_id in front matter
+            # Status only lists markdown files, so no suffix check is needed here
+            last_commit = self._get_last_commit() or {}
+            last_commit_data = self._get_last_commit_data() or {}
+            archives = []
             for file_path in status["deleted"]:
                 path = Path(file_path)
                 
-                # Only process markdown files
-                if path.suffix.lower() != ".md":
-                    continue
-                    
-                # Try to get the last committed version
-                last_commit = self._get_last_commit_data()
-                if not last_commit:
-                    continue
-                    
-                file_content = last_commit.get(str(path))
-                if not file_content:
-                    continue
-                    
-                # Extract front matter
-                front_matter, _ = extract_front_matter(file_content)
+                # Look up the front matter of the last committed version
+                front_matter = self._get_committed_front_matter(file_path, last_commit, last_commit_data)
                 
                 # Check if this file had a notion_id
                 if front_matter and "notion_id" in front_matter:
-                    # Archive the database item in Notion
-                    entry_id = front_matter["notion_id"]
-                    success = self.notion_client.archive_database_item(entry_id)
-                    if success:
-                        print_success(f"Archived database entry for deleted file {path}")
-                    else:
-                        print_warning(f"Failed to archive database entry for deleted file {path}")
+                    archives.append((path, front_matter["notion_id"]))
+            
+            # Archive the database items in Notion concurrently
+            results = self._run_concurrently(
+                lambda item: self.notion_client.archive_database_item(item[1]),
+                archives
+            )
+            for (path, _), (success, _) in zip(archives, results):
+                if success:
+                    print_success(f"Archived database entry for deleted file {path}")
+                else:
+                    print_warning(f"Failed to archive database entry for deleted file {path}")
             
             # Save a new commit
             return self._save_commit()
@@ -383,7 +594,7 @@ class NotionSync:
                         "last_edited_time": page.get("last_edited_time", "")
                     }
                     f.write("---\n")
-                    f.write(json.dumps(front_matter, indent=2))
+                    f.write(dumps_json(front_matter, indent=True).decode("utf-8"))
                     f.write("\n---\n\n")
                 
                 f.write(markdown_content)
@@ -392,13 +603,28 @@ class NotionSync:
             
             # Get child pages
             child_pages = self.notion_client.get_child_pages(page_id)
+            
+            # Skip children whose local copy is already at their last_edited_time
+            changed_children = []
             for child in child_pages:
-                child_id = child.get("id")
                 child_title = child.get("properties", {}).get("title", {}).get("title", [{}])[0].get("plain_text", "Untitled")
                 child_filename = f"{slugify(child_title)}.md"
-                
-                # Get child page content
-                child_content = self.notion_client.get_page_content(child_id)
+                last_edited_time = child.get("last_edited_time", "")
+                if last_edited_time and self._read_pulled_front_matter(child_filename).get("last_edited_time") == last_edited_time:
+                    print_info(f"Child page {child_filename} is unchanged, skipping")
+                    continue
+                changed_children.append((child, child_title, child_filename))
+            
+            # Fetch child page content concurrently
+            results = self._run_concurrently(
+                lambda item: self.notion_client.get_page_content(item[0].get("id")),
+                changed_children
+            )
+            for (child, child_title, child_filename), (child_content, error) in zip(changed_children, results):
+                if error:
+                    raise error
+                    
+                child_id = child.get("id")
                 
                 # Save child page
                 with open(child_filename, "w", encoding="utf-8") as f:
@@ -409,7 +635,7 @@ class NotionSync:
                         "last_edited_time": child.get("last_edited_time", "")
                     }
                     f.write("---\n")
-                    f.write(json.dumps(front_matter, indent=2))
+                    f.write(dumps_json(front_matter, indent=True).decode("utf-8"))
                     f.write("\n---\n\n")
                     
                     f.write(child_content)
@@ -446,8 +672,21 @@ class NotionSync:
                 print_error(f"Failed to retrieve database with ID: {database_id}")
                 return False
                 
-            # Get database entries
-            entries = self.notion_client.query_database(database_id)
+            # Only fetch entries edited since the newest edit seen by the last pull.
+            # Notion rounds last_edited_time to the minute, so entries from that minute
+            # are fetched again rather than risk missing a later edit within it.
+            last_pull = self._load_last_pull_times().get(database_id)
+            if last_pull:
+                entries = self.notion_client.query_database(
+                    database_id,
+                    filter={
+                        "timestamp": "last_edited_time",
+                        "last_edited_time": {"on_or_after": last_pull}
+                    }
+                )
+                print_info(f"Found {len(entries)} entries edited since {last_pull}")
+            else:
+                entries = self.notion_client.query_database(database_id)
             
             # Create folder for database if doesn't exist
             db_folder = Path("database")
@@ -459,11 +698,20 @@ class NotionSync:
                 "title": database.get("title", [{}])[0].get("plain_text", "Untitled Database"),
                 "properties": database.get("properties", {})
             }
-            with open(db_folder / "database.json", "w", encoding="utf-8") as f:
-                json.dump(db_info, f, indent=2)
+            with open(db_folder / "database.json", "wb") as f:
+                f.write(dumps_json(db_info, indent=True))
                 
+            # Fetch entry content concurrently
+            results = self._run_concurrently(
+                lambda entry: self.notion_client.get_page_content(entry.get("id")),
+                entries
+            )
+            
             # Process each database entry
-            for entry in entries:
+            for entry, (content, error) in zip(entries, results):
+                if error:
+                    raise error
+                    
                 entry_id = entry.get("id")
                 properties = entry.get("properties", {})
                 
@@ -477,9 +725,6 @@ class NotionSync:
                 # Create a filename from the title
                 filename = f"{slugify(title)}.md"
                 
-                # Get page content
-                content = self.notion_client.get_page_content(entry_id)
-                
                 # Save to file with front matter
                 file_path = db_folder / filename
                 with open(file_path, "w", encoding="utf-8") as f:
@@ -491,13 +736,18 @@ class NotionSync:
                         "last_edited_time": entry.get("last_edited_time", "")
                     }
                     f.write("---\n")
-                    f.write(json.dumps(front_matter, indent=2))
+                    f.write(dumps_json(front_matter, indent=True).decode("utf-8"))
                     f.write("\n---\n\n")
                     
                     f.write(content)
                     
                 print_success(f"Saved database entry to {file_path}")
             
+            # Use Notion's own timestamps as the watermark, not the local clock
+            newest_edit = max((entry.get("last_edited_time", "") for entry in entries), default="")
+            if newest_edit:
+                self._save_last_pull_time(database_id, newest_edit)
+            
             # Save this version as a commit
             return self._save_commit()
             
@@ -505,6 +755,143 @@ class NotionSync:
             print_error(f"Error pulling from database: {str(e)}")
             return False
 
+    def _read_pulled_front_matter(self, file_path):
+        """Read the JSON front matter written by a previous pull
+        
+        Args:
+            file_path (str): Path of the pulled markdown file
+            
+        Returns:
+            dict: The front matter, empty if the file is missing or has none
+        """
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except OSError:
+            return {}
+            
+        if not content.startswith("---\n"):
+            return {}
+        end = content.find("\n---", 4)
+        if end == -1:
+            return {}
+        try:
+            front_matter = loads_json(content[4:end])
+        except ValueError:
+            return {}
+        return front_matter if isinstance(front_matter, dict) else {}
+
+    def _load_last_pull_times(self):
+        """Load the last pull time of each database
+        
+        Returns:
+            dict: Dictionary of database IDs to the last_edited_time watermark of their last pull
+        """
+        try:
+            with open(self.last_pull_path, "rb") as f:
+                return loads_json(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_last_pull_time(self, database_id, pull_time):
+        """Record the newest edit seen when a database was last pulled
+        
+        Args:
+            database_id (str): The ID of the pulled database
+            pull_time (str): Largest last_edited_time among the pulled entries
+        """
+        last_pull_times = self._load_last_pull_times()
+        last_pull_times[database_id] = pull_time
+        write_file_atomic(self.last_pull_path, dumps_json(last_pull_times))
+
+    def _write_front_matter_updates(self, updates):
+        """Rewrite markdown files with updated front matter
+        
+        Front matter is written as one "key: value" line per entry, the same
+        format extract_front_matter reads back.
+        
+        Args:
+            updates (list): (path, front_matter, markdown_content) tuples
+        """
+        def write(update):
+            path, front_matter, markdown_content = update
+            lines = "".join(f"{key}: {value}\n" for key, value in front_matter.items())
+            write_file_atomic(path, f"---\n{lines}---\n\n{markdown_content}".encode("utf-8"))
+        
+        if not updates:
+            return
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            # Consume the iterator so write errors are raised here
+            list(executor.map(write, updates))
+
+    async def _call_with_retry(self, func, item, executor, semaphore, idempotent=True):
+        """Call a Notion API function, retrying rate-limited and server errors
+        
+        The blocking client call runs on the executor; backoff waits happen on
+        the event loop so they do not tie up a worker thread.
+        
+        Args:
+            func (callable): The API function to call with the item
+            item: Work item passed to the function
+            executor (ThreadPoolExecutor): Executor running the blocking call
+            semaphore (asyncio.Semaphore): Limits the number of requests in flight
+            idempotent (bool): Whether the call is safe to repeat; when False
+                only rate limiting (429) is retried
+            
+        Returns:
+            The return value of the function
+        """
+        loop = asyncio.get_running_loop()
+        retryable = RETRYABLE_STATUS_CODES if idempotent else NON_IDEMPOTENT_RETRYABLE_STATUS_CODES
+        for attempt in range(MAX_API_RETRIES):
+            try:
+                async with semaphore:
+                    return await loop.run_in_executor(executor, func, item)
+            except Exception as e:
+                status = getattr(e, "status", None) or getattr(getattr(e, "response", None), "status_code", None)
+                if status not in retryable or attempt == MAX_API_RETRIES - 1:
+                    raise
+                # Exponential backoff with jitter
+                await asyncio.sleep(2 ** attempt + random.random())
+
+    async def _gather_api_calls(self, func, items, idempotent=True):
+        """Run a Notion API function over all items on one event loop
+        
+        Args:
+            func (callable): Function called with each item
+            items (list): Work items
+            idempotent (bool): Whether the calls are safe to repeat
+            
+        Returns:
+            list: Results or exceptions in the same order as items
+        """
+        semaphore = asyncio.Semaphore(MAX_API_WORKERS)
+        with ThreadPoolExecutor(max_workers=MAX_API_WORKERS) as executor:
+            return await asyncio.gather(
+                *(self._call_with_retry(func, item, executor, semaphore, idempotent) for item in items),
+                return_exceptions=True
+            )
+
+    def _run_concurrently(self, func, items, idempotent=True):
+        """Run a Notion API function over items with bounded concurrency
+        
+        Args:
+            func (callable): Function called with each item
+            items (list): Work items
+            idempotent (bool): Whether the calls are safe to repeat; creates
+                pass False so server errors are not retried into duplicates
+            
+        Returns:
+            list: (result, error) tuples in the same order as items
+        """
+        if not items:
+            return []
+        results = asyncio.run(self._gather_api_calls(func, items, idempotent))
+        return [
+            (None, result) if isinstance(result, Exception) else (result, None)
+            for result in results
+        ]
+
     def _get_current_files(self):
         """Get current markdown files with their hash
         
@@ -512,51 +899,255 @@ class NotionSync:
             dict: Dictionary of file paths to their hash
         """
         files = {}
+        hash_cache = self._load_hash_cache()
+        new_cache = {}
+        to_hash = []
         
-        # Walk through all files in the current directory
-        for root, _, filenames in os.walk("."):
-            # Skip the .notionsync directory
-            if ".notionsync" in root:
-                continue
+        # Walk through all markdown files in the current directory
+        for entry in self._walk_markdown_files("."):
+            file_path = entry.path
+            # Remove ./ from the start if present
+            if file_path.startswith("./"):
+                file_path = file_path[2:]
                 
-            for filename in filenames:
-                # Only include markdown files
-                if not filename.endswith(".md"):
-                    continue
-                    
-                file_path = os.path.join(root, filename)
-                # Remove ./ from the start if present
-                if file_path.startswith("./"):
-                    file_path = file_path[2:]
-                    
-                with open(file_path, "rb") as f:
-                    file_hash = hashlib.md5(f.read()).hexdigest()
-                    
-                files[file_path] = file_hash
+            # Reuse the cached hash if the file is unchanged on disk
+            stat = entry.stat()
+            cached = hash_cache.get(file_path)
+            if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                file_hash = cached["hash"]
+            else:
+                file_hash = None
+                to_hash.append(file_path)
+                
+            files[file_path] = file_hash
+            new_cache[file_path] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "hash": file_hash
+            }
+            
+        # Hash changed files in parallel; hashlib releases the GIL while hashing
+        if to_hash:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                for file_path, file_hash in zip(to_hash, executor.map(self._hash_file, to_hash)):
+                    files[file_path] = file_hash
+                    new_cache[file_path]["hash"] = file_hash
+            
+        if new_cache != hash_cache:
+            self._save_hash_cache(new_cache)
                 
         return files
 
+    def _walk_markdown_files(self, directory):
+        """Recursively yield markdown file entries, skipping the .notionsync directory
+        
+        Args:
+            directory (str): Directory to scan
+            
+        Yields:
+            os.DirEntry: Entry for each markdown file found
+        """
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name == ".notionsync":
+                        continue
+                    yield from self._walk_markdown_files(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    yield entry
+
+    def _load_hash_cache(self):
+        """Load the file hash cache
+        
+        Returns:
+            dict: Dictionary of file paths to their mtime, size and hash
+        """
+        try:
+            with open(self.hash_cache_path, "rb") as f:
+                return loads_json(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_hash_cache(self, hash_cache):
+        """Save the file hash cache
+        
+        Args:
+            hash_cache (dict): Dictionary of file paths to their mtime, size and hash
+        """
+        try:
+            write_file_atomic(self.hash_cache_path, dumps_json(hash_cache))
+        except OSError as e:
+            print_warning(f"Could not save hash cache: {str(e)}")
+
+    def _scan_files_with_content(self):
+        """Get current markdown files with their hash and content, reading each file once
+        
+        Returns:
+            tuple: (hashes, contents) dictionaries keyed by file path
+        """
+        file_paths = []
+        new_cache = {}
+        
+        for entry in self._walk_markdown_files("."):
+            file_path = entry.path
+            # Remove ./ from the start if present
+            if file_path.startswith("./"):
+                file_path = file_path[2:]
+            file_paths.append(file_path)
+            
+            stat = entry.stat()
+            new_cache[file_path] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "hash": None
+            }
+            
+        hashes = {}
+        contents = {}
+        if file_paths:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                for file_path, (file_hash, content) in zip(file_paths, executor.map(self._read_and_hash_file, file_paths)):
+                    hashes[file_path] = file_hash
+                    contents[file_path] = content
+                    new_cache[file_path]["hash"] = file_hash
+        
+        # Refresh the hash cache since every file was just hashed
+        self._save_hash_cache(new_cache)
+        
+        return hashes, contents
+
+    def _read_and_hash_file(self, file_path):
+        """Read a file once and return both its hash and decoded content
+        
+        Args:
+            file_path (str): Path of the file to read
+            
+        Returns:
+            tuple: (hex digest, content decoded as UTF-8)
+        """
+        with open(file_path, "rb") as f:
+            data = f.read()
+        return hashlib.blake2b(data, digest_size=16).hexdigest(), data.decode("utf-8")
+
+    def _hash_file(self, file_path):
+        """Hash a file incrementally without loading it wholly into memory
+        
+        Args:
+            file_path (str): Path of the file to hash
+            
+        Returns:
+            str: Hex digest of the file contents
+        """
+        h = hashlib.blake2b(digest_size=16)
+        with open(file_path, "rb", buffering=0) as f:
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def _load_last_commit(self):
+        """Load the latest commit data, caching it for the lifetime of this instance
+        
+        Returns:
+            dict: The latest commit data, or None if no commits
+        """
+        if self._last_commit_cache is None:
+            latest_commit = self._get_head_commit_path()
+            if latest_commit is None:
+                return None
+                
+            # Load the commit data
+            self._last_commit_cache = loads_json(read_file_data(latest_commit))
+                
+        return self._last_commit_cache
+
+    def _get_head_commit_path(self):
+        """Get the path of the latest commit file
+        
+        Returns:
+            Path: Path of the latest commit file, or None if no commits
+        """
+        # HEAD holds the filename of the latest commit
+        try:
+            head_commit = self.commits_dir / self.head_path.read_text(encoding="utf-8").strip()
+            if head_commit.is_file():
+                return head_commit
+        except OSError:
+            pass
+            
+        # Fall back to the commit with the highest timestamp in its filename
+        commit_files = chain(self.commits_dir.glob("*.json"), self.commits_dir.glob(f"*.json{ZSTD_SUFFIX}"))
+        return max(commit_files, key=lambda x: x.name.split(".", 1)[0], default=None)
+
+    def _load_front_matter_index(self):
+        """Load the front matter index written at commit time
+        
+        Returns:
+            dict: Dictionary of file paths to their hash and front matter
+        """
+        if self._front_matter_index is None:
+            try:
+                with open(self.front_matter_index_path, "rb") as f:
+                    self._front_matter_index = loads_json(f.read())
+            except (OSError, ValueError):
+                self._front_matter_index = {}
+        return self._front_matter_index
+
+    def _save_front_matter_index(self, files, file_contents):
+        """Save the front matter of the files being committed
+        
+        Args:
+            files (dict): Dictionary of file paths to their hash
+            file_contents (dict): Dictionary of file paths to their content
+        """
+        old_index = self._load_front_matter_index()
+        index = {}
+        for file_path, file_hash in files.items():
+            entry = old_index.get(file_path)
+            if entry and entry["hash"] == file_hash:
+                index[file_path] = entry
+            else:
+                front_matter, _ = parse_front_matter(file_contents[file_path])
+                index[file_path] = {"hash": file_hash, "front_matter": front_matter}
+                
+        write_file_atomic(self.front_matter_index_path, dumps_json(index))
+        self._front_matter_index = index
+
+    def _get_committed_front_matter(self, file_path, last_commit, last_commit_data):
+        """Get the front matter of a file as of the last commit
+        
+        Args:
+            file_path (str): Path of the committed file
+            last_commit (dict): File paths to their hash in the last commit
+            last_commit_data (Mapping): File paths to their content in the last commit
+            
+        Returns:
+            dict: The front matter, empty if the file was not committed
+        """
+        if file_path not in last_commit:
+            return {}
+            
+        # Use the index when it was built from the same content
+        entry = self._load_front_matter_index().get(file_path)
+        if entry and entry["hash"] == last_commit[file_path]:
+            return dict(entry["front_matter"])
+            
+        # Fall back to parsing the committed content
+        file_content = last_commit_data.get(file_path)
+        if not file_content:
+            return {}
+        front_matter, _ = parse_front_matter(file_content)
+        return front_matter
+
     def _get_last_commit(self):
         """Get the last commit information
         
         Returns:
             dict: Dictionary of file paths to their hash, or None if no commits
         """
-        # Get all commit files
-        commit_files = list(self.commits_dir.glob("*.json"))
-        if not commit_files:
+        commit_data = self._load_last_commit()
+        if commit_data is None:
             return None
             
-        # Sort by timestamp in filename
-        commit_files.sort(key=lambda x: x.stem)
-        
-        # Get the latest commit
-        latest_commit = commit_files[-1]
-        
-        # Load the commit data
-        with open(latest_commit, "r", encoding="utf-8") as f:
-            commit_data = json.load(f)
-            
         return commit_data.get("files", {})
 
     def _get_last_commit_data(self):
@@ -565,22 +1156,17 @@ class NotionSync:
         Returns:
             dict: Dictionary of file paths to their content, or None if no commits
         """
-        # Get all commit files
-        commit_files = list(self.commits_dir.glob("*.json"))
-        if not commit_files:
+        commit_data = self._load_last_commit()
+        if commit_data is None:
             return None
             
-        # Sort by timestamp in filename
-        commit_files.sort(key=lambda x: x.stem)
-        
-        # Get the latest commit
-        latest_commit = commit_files[-1]
-        
-        # Load the commit data
-        with open(latest_commit, "r", encoding="utf-8") as f:
-            commit_data = json.load(f)
+        # Commits written before the object store embed contents directly
+        if "file_contents" in commit_data:
+            return commit_data["file_contents"]
             
-        return commit_data.get("file_contents", {})
+        if self._last_commit_contents is None:
+            self._last_commit_contents = CommitContents(commit_data.get("files", {}), self.objects_dir)
+        return self._last_commit_contents
 
     def _save_commit(self):
         """Save current state as a commit
@@ -589,29 +1175,38 @@ class NotionSync:
             bool: True if successful, False otherwise
         """
         try:
-            # Get current files
-            files = self._get_current_files()
+            # Get current files and their contents in a single pass
+            files, file_contents = self._scan_files_with_content()
             
-            # Get file contents for reference
-            file_contents = {}
-            for file_path in files:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    file_contents[file_path] = f.read()
+            # Store each unique content once in the object store
+            for file_path, file_hash in files.items():
+                if find_object_path(self.objects_dir, file_hash) is None:
+                    data, suffix = compress_data(file_contents[file_path].encode("utf-8"))
+                    write_file_atomic(self.objects_dir / f"{file_hash}.md{suffix}", data)
             
-            # Create commit data
+            # Record parsed front matter so later pushes can skip reparsing
+            self._save_front_matter_index(files, file_contents)
+            
+            # Create commit data; contents are referenced by hash
             commit_data = {
                 "timestamp": datetime.now().isoformat(),
-                "files": files,
-                "file_contents": file_contents
+                "files": files
             }
             
             # Create commit filename with timestamp
-            commit_filename = f"{int(datetime.now().timestamp())}.json"
+            data, suffix = compress_data(dumps_json(commit_data))
+            commit_filename = f"{int(datetime.now().timestamp())}.json{suffix}"
             commit_path = self.commits_dir / commit_filename
             
             # Save commit data
-            with open(commit_path, "w", encoding="utf-8") as f:
-                json.dump(commit_data, f, indent=2)
+            write_file_atomic(commit_path, data)
+                
+            # Point HEAD at the new commit atomically
+            write_file_atomic(self.head_path, commit_filename.encode("utf-8"))
+            
+            # The commit just written is now the latest one
+            self._last_commit_cache = commit_data
+            self._last_commit_contents = None
                 
             print_success(f"Saved commit to {commit_path}")
             return True
@@ -1,13 +0,0 @@
-#!/usr/bin/env python3
-"""
-NotionSync CLI - Command Line Interface for NotionSync
-"""
-
-from .notiongit import cli
-
-def main():
-    """Main entry point for the CLI."""
-    cli()
-
-if __name__ == "__main__":
-    main() 
\ No newline at end of file
@@ -5,22 +5,41 @@ This module provides CLI commands for NotionSync.
 """
 
 import os
+import sys
 import json
 import click
-from rich.console import Console
-from rich.table import Table
+from functools import lru_cache
 from pathlib import Path
 
-from ..core.sync import NotionSync
 from ..utils.helpers import load_env_variables, get_file_changes
+from ..utils.console import console
 
-# Initialize rich console for better output formatting
-console = Console()
+# Escapes for fields of the piped log output, so every commit stays on one tab-separated line
+TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+def create_sync():
+    """Create a NotionSync from the environment variables"""
+    env = load_env_variables()
+    
+    from ..core.sync import NotionSync
+    return NotionSync(
+        api_key=env["api_key"],
+        page_id=env["page_id"],
+        database_id=env["database_id"]
+    )
+
+def get_sync(ctx=None):
+    """Get the NotionSync for a command, shared across the click context when there is one"""
+    if ctx is not None and isinstance(ctx.obj, dict) and "sync_factory" in ctx.obj:
+        return ctx.obj["sync_factory"]()
+    return create_sync()
 
 @click.group()
-def cli():
+@click.pass_context
+def cli(ctx):
     """NotionSync - A Git-like CLI tool for syncing Markdown files with Notion pages"""
-    pass
+    ctx.ensure_object(dict)
+    ctx.obj["sync_factory"] = lru_cache(maxsize=None)(create_sync)
 
 def init_command(options, ctx=None):
     """Initialize a new NotionSync project"""
@@ -34,15 +53,8 @@ def init_command(options, ctx=None):
             f.write("# NOTION_DATABASE_ID=your_database_id_here\n")
         console.print("[green]Created .env file. Please edit it with your Notion API credentials.[/green]")
     
-    # Load environment variables
-    env = load_env_variables()
-    
     # Initialize NotionSync
-    sync = NotionSync(
-        api_key=env["api_key"],
-        page_id=env["page_id"],
-        database_id=env["database_id"]
-    )
+    sync = get_sync(ctx)
     
     # Create index.md if it doesn't exist
     sync.create_index_md_if_missing()
@@ -53,15 +65,8 @@ def init_command(options, ctx=None):
 
 def status_command(options, ctx=None):
     """Show status of local files compared to last commit"""
-    # Load environment variables
-    env = load_env_variables()
-    
     # Initialize NotionSync
-    sync = NotionSync(
-        api_key=env["api_key"],
-        page_id=env["page_id"],
-        database_id=env["database_id"]
-    )
+    sync = get_sync(ctx)
     
     # Get status
     status = sync.status()
@@ -73,6 +78,8 @@ def status_command(options, ctx=None):
     
     console.print(f"[yellow]Changes since last commit:[/yellow]")
     
+    from rich.table import Table
+    
     # Added files
     if status["added"]:
         table = Table(title="New Files")
@@ -112,60 +119,32 @@ def commit_command(options, ctx=None):
         console.print("[red]Error: Commit message is required[/red]")
         return None
         
-    # Load environment variables
-    env = load_env_variables()
-    
     # Initialize NotionSync
-    sync = NotionSync(
-        api_key=env["api_key"],
-        page_id=env["page_id"],
-        database_id=env["database_id"]
-    )
+    sync = get_sync(ctx)
     
     # Commit changes
     return sync.commit(message)
 
 def push_command(options, ctx=None):
     """Push committed changes to Notion"""
-    # Load environment variables
-    env = load_env_variables()
-    
     # Initialize NotionSync
-    sync = NotionSync(
-        api_key=env["api_key"],
-        page_id=env["page_id"],
-        database_id=env["database_id"]
-    )
+    sync = get_sync(ctx)
     
     # Push changes
     return sync.push()
 
 def pull_command(options, ctx=None):
     """Pull content from Notion to local files"""
-    # Load environment variables
-    env = load_env_variables()
-    
     # Initialize NotionSync
-    sync = NotionSync(
-        api_key=env["api_key"],
-        page_id=env["page_id"],
-        database_id=env["database_id"]
-    )
+    sync = get_sync(ctx)
     
     # Pull changes
     return sync.pull()
 
 def log_command(options, ctx=None):
     """Show commit history"""
-    # Load environment variables
-    env = load_env_variables()
-    
     # Initialize NotionSync
-    sync = NotionSync(
-        api_key=env["api_key"],
-        page_id=env["page_id"],
-        database_id=env["database_id"]
-    )
+    sync = get_sync(ctx)
     
     # List commits
     commits_dir = sync.config_dir / "commits"
@@ -173,62 +152,69 @@ def log_command(options, ctx=None):
         console.print("[yellow]No commits found.[/yellow]")
         return []
     
-    commit_files = sorted(commits_dir.glob("*.json"), reverse=True)
-    
-    table = Table(title="Commit History")
-    table.add_column("Date", style="cyan")
-    table.add_column("Message", style="green")
-    table.add_column("Files", style="yellow")
+    # When piped, write plain tab-separated lines and skip rich rendering entirely
+    interactive = sys.stdout.isatty()
+    if interactive:
+        from rich.markup import escape
     
     log_entries = []
     
-    for commit_file in commit_files:
-        # Load commit data
-        with open(commit_file, "r", encoding="utf-8") as f:
-            commit_data = json.load(f)
-        
-        timestamp = commit_data["timestamp"]
-        message = commit_data["message"]
-        file_count = len(commit_data["files"])
+    # Print each commit as soon as its summary is read from the commit index
+    for commit in sync.iter_commit_log(options.get("max_count")):
+        timestamp = commit["timestamp"]
+        message = commit["message"]
+        file_count = commit["file_count"]
         
         log_entry = f"{timestamp}: {message} ({file_count} files)"
         log_entries.append(log_entry)
         
-        table.add_row(timestamp, message, str(file_count))
+        if interactive:
+            console.print(f"[cyan]{timestamp}[/cyan] [green]{escape(message)}[/green] [yellow]({file_count} files)[/yellow]")
+        else:
+            sys.stdout.write(f"{timestamp}\t{message.translate(TSV_ESCAPES)}\t{file_count}\n")
+    
+    if not log_entries:
+        console.print("[yellow]No commits found.[/yellow]")
     
-    console.print(table)
     return log_entries
 
 @cli.command()
-def init():
+@click.pass_context
+def init(ctx):
     """Initialize a new NotionSync project"""
-    return init_command({})
+    return init_command({}, ctx)
 
 @cli.command()
-def status():
+@click.pass_context
+def status(ctx):
     """Show status of local files compared to last commit"""
-    return status_command({})
+    return status_command({}, ctx)
 
 @cli.command()
 @click.option("-m", "--message", required=True, help="Commit message")
-def commit(message):
+@click.pass_context
+def commit(ctx, message):
     """Commit changes to local storage"""
-    return commit_command({"message": message})
+    return commit_command({"message": message}, ctx)
 
 @cli.command()
-def push():
+@click.pass_context
+def push(ctx):
     """Push committed changes to Notion"""
-    return push_command({})
+    return push_command({}, ctx)
 
 @cli.command()
-def pull():
+@click.pass_context
+def pull(ctx):
     """Pull content from Notion to local files"""
-    return pull_command({})
+    return pull_command({}, ctx)
 
 @cli.command()
-def log():
+@click.option("-n", "--max-count", type=click.IntRange(min=1), default=50, show_default=True, help="Limit the number of commits shown")
+@click.pass_context
+def log(ctx, max_count):
     """Show commit history"""
-    return log_command({})
+    return log_command({"max_count": max_count}, ctx)
 
 def main():
     """Main entry point for the CLI"""
@@ -5,32 +5,138 @@ This module handles all interactions with the Notion API.
 """
 
 import os
-import json
-from notion_client import Client
-from rich.console import Console
+import random
+import time
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 
-# Initialize rich console for better output formatting
-console = Console()
+from ..utils.helpers import read_json, write_json
+from ..utils.console import console
+
+# notion_client (and httpx behind it) is imported on first API use; see NotionApiClient.client
+Client = None
+
+# Maximum number of child blocks Notion accepts in a single request
+MAX_BLOCKS_PER_REQUEST = 100
+
+# Maximum number of requests kept in flight when issuing independent calls
+MAX_CONCURRENT_REQUESTS = 8
+
+# Number of attempts for a rate-limited or failed request before giving up
+MAX_RETRIES = 5
+
+# Upper bound in seconds on the wait between retries
+MAX_RETRY_DELAY = 16
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Size of the keep-alive connection pool shared by all requests of a client
+MAX_CONNECTIONS = 20
+
+# Notion's average rate limit per integration, and the burst allowed above it
+REQUESTS_PER_SECOND = 3
+REQUEST_BURST = 10
+
+# Notion rounds last_edited_time to the minute, so content fetched this soon after an
+# edit may miss a later edit in the same minute and is not served from the page cache
+PAGE_CACHE_SETTLE_TIME = timedelta(minutes=2)
+
+def _is_transient_error(error):
+    """Whether a failed API call may succeed if retried"""
+    if getattr(error, "status", None) in RETRYABLE_STATUS_CODES:
+        return True
+    
+    import httpx
+    from notion_client.errors import RequestTimeoutError
+    return isinstance(error, (httpx.TransportError, RequestTimeoutError))
+
+def _parse_timestamp(value):
+    """Parse an ISO 8601 timestamp as returned by Notion, or None if it is not one"""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+
+def _retry_after(error):
+    """Seconds the server asked to wait before retrying, or None if it did not say"""
+    headers = getattr(error, "headers", None)
+    try:
+        return float(headers["retry-after"])
+    except (TypeError, KeyError, ValueError):
+        return None
+
+class RateLimiter:
+    """Thread-safe token bucket that spaces calls to an average rate, allowing short bursts"""
+    
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Wait until a call may be made"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Taking a token ahead of time reserves a slot, so waiting callers are served in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
 
 class NotionApiClient:
     """Notion API client for interacting with Notion"""
     
-    def __init__(self, api_key=None, page_id=None, database_id=None):
-        """Initialize the Notion API client"""
+    def __init__(self, api_key=None, page_id=None, database_id=None, cache_dir=None):
+        """Initialize the Notion API client
+        
+        Args:
+            cache_dir: Directory for the page content cache; caching is disabled when None
+        """
         self.api_key = api_key or os.getenv("NOTION_API_KEY")
         self.page_id = page_id
         self.database_id = database_id
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._page_cache = None
+        self._page_cache_lock = threading.Lock()
+        self._rate_limiter = RateLimiter(REQUESTS_PER_SECOND, REQUEST_BURST)
         
         if not self.api_key:
             console.print("[bold red]Error: NOTION_API_KEY not found in environment variables.[/bold red]")
             raise ValueError("NOTION_API_KEY is required")
+    
+    @cached_property
+    def client(self):
+        """The underlying notion_client Client, created on first use"""
+        global Client
+        if Client is None:
+            from notion_client import Client
+        import httpx
         
-        self.client = Client(auth=self.api_key)
+        from notion_client.client import ClientOptions
+        
+        # Reuse connections across requests instead of a new TLS handshake per call
+        http_client = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=MAX_CONNECTIONS, max_connections=MAX_CONNECTIONS)
+        )
+        options = {"auth": self.api_key}
+        # Newer clients retry on their own; _call_with_backoff already does, so turn that off
+        # rather than multiply the attempts and sleeps of every call
+        if "retry" in getattr(ClientOptions, "__dataclass_fields__", {}):
+            options["retry"] = False
+        return Client(client=http_client, **options)
     
     def get_page(self, page_id):
         """Get a Notion page by ID"""
         try:
-            return self.client.pages.retrieve(page_id=page_id)
+            return self._call_with_backoff(self.client.pages.retrieve, page_id=page_id)
         except Exception as e:
             console.print(f"[bold red]Error retrieving page: {e}[/bold red]")
             raise
@@ -38,16 +144,15 @@ class NotionApiClient:
     def update_page(self, page_id, properties=None, content=None):
         """Update a Notion page"""
         try:
+            self._invalidate_cached_content(page_id)
+            
             # Update page properties if provided
             if properties:
-                self.client.pages.update(page_id=page_id, properties=properties)
+                self._call_with_backoff(self.client.pages.update, page_id=page_id, properties=properties)
             
             # Update page content if provided
             if content:
-                self.client.blocks.children.append(
-                    block_id=page_id,
-                    children=content
-                )
+                self.append_blocks(page_id, content)
             
             return True
         except Exception as e:
@@ -57,7 +162,7 @@ class NotionApiClient:
     def get_database(self, database_id):
         """Get a Notion database by ID"""
         try:
-            return self.client.databases.retrieve(database_id=database_id)
+            return self._call_with_backoff(self.client.databases.retrieve, database_id=database_id)
         except Exception as e:
             console.print(f"[bold red]Error retrieving database: {e}[/bold red]")
             raise
@@ -65,7 +170,8 @@ class NotionApiClient:
     def query_database(self, database_id, filter=None, sorts=None):
         """Query a Notion database"""
         try:
-            return self.client.databases.query(
+            return self._call_with_backoff(
+                self.client.databases.query,
                 database_id=database_id,
                 filter=filter,
                 sorts=sorts
@@ -74,38 +180,172 @@ class NotionApiClient:
             console.print(f"[bold red]Error querying database: {e}[/bold red]")
             raise
     
+    def query_database_all(self, database_id, filter=None):
+        """Query a Notion database, following pagination to return every matching entry"""
+        try:
+            entries = []
+            start_cursor = None
+            while True:
+                kwargs = {"database_id": database_id}
+                if filter:
+                    kwargs["filter"] = filter
+                if start_cursor:
+                    kwargs["start_cursor"] = start_cursor
+                response = self._call_with_backoff(self.client.databases.query, **kwargs)
+                entries.extend(response["results"])
+                
+                if not response.get("has_more"):
+                    return entries
+                start_cursor = response["next_cursor"]
+        except Exception as e:
+            console.print(f"[bold red]Error querying database: {e}[/bold red]")
+            raise
+    
     def create_page(self, parent, properties, content=None):
         """Create a new Notion page"""
         try:
-            page = self.client.pages.create(
-                parent=parent,
-                properties=properties
-            )
+            # Send the first batch of blocks with the create request itself
+            content = content or []
+            create_args = {"parent": parent, "properties": properties}
+            if content:
+                create_args["children"] = content[:MAX_BLOCKS_PER_REQUEST]
+            page = self._call_with_backoff(self.client.pages.create, idempotent=False, **create_args)
             
-            # Add content if provided
-            if content and page:
-                self.client.blocks.children.append(
-                    block_id=page["id"],
-                    children=content
-                )
+            # Append any remaining content
+            if len(content) > MAX_BLOCKS_PER_REQUEST and page:
+                self.append_blocks(page["id"], content[MAX_BLOCKS_PER_REQUEST:])
             
             return page
         except Exception as e:
             console.print(f"[bold red]Error creating page: {e}[/bold red]")
             raise
     
-    def get_page_content(self, page_id):
-        """Get the content blocks of a Notion page"""
+    def append_blocks(self, block_id, blocks):
+        """Append blocks to a Notion block in batches of up to 100"""
         try:
-            return self.client.blocks.children.list(block_id=page_id)["results"]
+            for start in range(0, len(blocks), MAX_BLOCKS_PER_REQUEST):
+                self._call_with_backoff(
+                    self.client.blocks.children.append,
+                    idempotent=False,
+                    block_id=block_id,
+                    children=blocks[start:start + MAX_BLOCKS_PER_REQUEST]
+                )
+            
+            return True
+        except Exception as e:
+            console.print(f"[bold red]Error appending blocks: {e}[/bold red]")
+            raise
+    
+    def get_page_content(self, page_id, last_edited_time=None):
+        """Get the content blocks of a Notion page
+        
+        When a cache directory is set, blocks are served from the page cache as
+        long as the page's last_edited_time is unchanged and the cached copy was
+        fetched well after that edit.
+        
+        Args:
+            page_id: The ID of the page
+            last_edited_time: The page's last_edited_time if already known;
+                retrieved from Notion when omitted
+            
+        Returns:
+            list: The page's content blocks
+        """
+        try:
+            if not self.cache_dir:
+                return self._list_blocks(page_id)
+            
+            if last_edited_time is None:
+                last_edited_time = self.get_page(page_id)["last_edited_time"]
+            
+            blocks = self._get_cached_content(page_id, last_edited_time)
+            if blocks is None:
+                fetched_at = datetime.now(timezone.utc)
+                blocks = self._list_blocks(page_id)
+                self._store_cached_content(page_id, last_edited_time, blocks, fetched_at)
+            
+            return blocks
         except Exception as e:
             console.print(f"[bold red]Error retrieving page content: {e}[/bold red]")
             raise
     
+    def _list_blocks(self, block_id):
+        """List all child blocks of a block straight from Notion, following pagination"""
+        blocks = []
+        start_cursor = None
+        while True:
+            kwargs = {"block_id": block_id}
+            if start_cursor:
+                kwargs["start_cursor"] = start_cursor
+            response = self._call_with_backoff(self.client.blocks.children.list, **kwargs)
+            blocks.extend(response["results"])
+            
+            if not response.get("has_more"):
+                return blocks
+            start_cursor = response["next_cursor"]
+    
+    def _load_page_cache(self):
+        """Load the page cache index, {page_id: {last_edited_time, fetched_at, path}}"""
+        if self._page_cache is None:
+            cache_file = self.cache_dir / "page_cache.json"
+            try:
+                self._page_cache = read_json(cache_file)
+            except (OSError, ValueError):
+                self._page_cache = {}
+        return self._page_cache
+    
+    def _save_page_cache(self):
+        """Write the page cache index atomically"""
+        write_json(self.cache_dir / "page_cache.json", self._page_cache, atomic=True)
+    
+    def _get_cached_content(self, page_id, last_edited_time):
+        """Return cached blocks for a page, or None if missing or stale"""
+        with self._page_cache_lock:
+            entry = self._load_page_cache().get(page_id)
+        if not entry or entry["last_edited_time"] != last_edited_time:
+            return None
+        
+        # A copy fetched within a minute or two of the edit may predate another edit
+        # that left the rounded last_edited_time unchanged
+        edited_at = _parse_timestamp(last_edited_time)
+        fetched_at = _parse_timestamp(entry.get("fetched_at"))
+        if edited_at is None or fetched_at is None or fetched_at - edited_at < PAGE_CACHE_SETTLE_TIME:
+            return None
+        
+        try:
+            return read_json(self.cache_dir / entry["path"])
+        except (OSError, ValueError):
+            return None
+    
+    def _store_cached_content(self, page_id, last_edited_time, blocks, fetched_at):
+        """Store a page's blocks in the page cache, with the time they were fetched"""
+        blocks_dir = self.cache_dir / "page_cache"
+        blocks_dir.mkdir(parents=True, exist_ok=True)
+        blocks_path = Path("page_cache") / f"{page_id}.json"
+        
+        write_json(self.cache_dir / blocks_path, blocks)
+        
+        with self._page_cache_lock:
+            self._load_page_cache()[page_id] = {
+                "last_edited_time": last_edited_time,
+                "fetched_at": fetched_at.isoformat(),
+                "path": blocks_path.as_posix()
+            }
+            self._save_page_cache()
+    
+    def _invalidate_cached_content(self, page_id):
+        """Drop a page from the page cache after writing to it"""
+        if not self.cache_dir:
+            return
+        
+        with self._page_cache_lock:
+            if self._load_page_cache().pop(page_id, None) is not None:
+                self._save_page_cache()
+    
     def delete_block(self, block_id):
         """Delete a Notion block"""
         try:
-            return self.client.blocks.delete(block_id=block_id)
+            return self._call_with_backoff(self.client.blocks.delete, block_id=block_id)
         except Exception as e:
             console.print(f"[bold red]Error deleting block: {e}[/bold red]")
             raise
@@ -114,20 +354,20 @@ class NotionApiClient:
         """Get all child pages of a Notion page"""
         try:
             # Query for all child blocks
-            blocks = self.client.blocks.children.list(block_id=parent_page_id)["results"]
+            blocks = self._list_blocks(parent_page_id)
             
             # Filter for child page blocks
-            child_pages = []
+            child_page_ids = []
             for block in blocks:
                 if block["type"] == "child_page":
-                    # Get the full page details
-                    page_details = self.get_page(block["id"])
-                    child_pages.append(page_details)
+                    child_page_ids.append(block["id"])
                 elif block["type"] == "child_database":
                     # Future enhancement: handle child databases
                     console.print(f"[yellow]Found child database: {block['id']} (databases not fully supported yet)[/yellow]")
             
-            return child_pages
+            # Get the full page details concurrently, keeping block order
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                return list(executor.map(self.get_page, child_page_ids))
         except Exception as e:
             console.print(f"[bold red]Error retrieving child pages: {e}[/bold red]")
             raise
@@ -135,22 +375,52 @@ class NotionApiClient:
     def clear_page_content(self, page_id):
         """Clear all content from a Notion page"""
         try:
+            self._invalidate_cached_content(page_id)
+            
             # Get all blocks
-            blocks = self.get_page_content(page_id)
+            blocks = self._list_blocks(page_id)
             
-            # Delete each block
-            for block in blocks:
-                self.delete_block(block["id"])
+            # Delete blocks concurrently, backing off when rate limited
+            def delete(block):
+                return self._call_with_backoff(self.client.blocks.delete, block_id=block["id"])
+            
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                list(executor.map(delete, blocks))
             
             return True
         except Exception as e:
             console.print(f"[bold red]Error clearing page content: {e}[/bold red]")
             raise
     
+    def _call_with_backoff(self, func, idempotent=True, **kwargs):
+        """
+        Call a Notion API function, retrying transient failures with exponential backoff
+        
+        Calls are paced by a token bucket to stay under Notion's rate limit.
+        Rate limiting (429) is always retried, after the server's Retry-After
+        when given. Server errors, timeouts and connection failures are only
+        retried for idempotent calls, since the request may already have been applied.
+        """
+        for attempt in range(MAX_RETRIES):
+            self._rate_limiter.acquire()
+            try:
+                return func(**kwargs)
+            except Exception as e:
+                if attempt == MAX_RETRIES - 1:
+                    raise
+                if getattr(e, "status", None) != 429 and not (idempotent and _is_transient_error(e)):
+                    raise
+                delay = _retry_after(e) if getattr(e, "status", None) == 429 else None
+                if delay is None:
+                    delay = min(MAX_RETRY_DELAY, 2 ** attempt * 0.5) + random.random() * 0.5
+                time.sleep(delay)
+    
     def create_database(self, parent, title, properties):
         """Create a new Notion database"""
         try:
-            return self.client.databases.create(
+            return self._call_with_backoff(
+                self.client.databases.create,
+                idempotent=False,
                 parent=parent,
                 title=[{"text": {"content": title}}],
                 properties=properties
@@ -5,96 +5,389 @@ This module handles the synchronization between local markdown files and Notion
 """
 
 import os
-import json
+import re
+import heapq
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from rich.console import Console
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 from ..markdown.converter import MarkdownConverter
 from .notion_client import NotionApiClient
-from ..utils.helpers import extract_front_matter
+from ..utils.helpers import extract_front_matter, read_json, write_json, write_file_atomic, hash_content
+from ..utils.console import console
+
+# Parsed config files, keyed by path, as (file version, config) pairs; see config_version
+_config_cache = {}
+
+# Maximum number of pages pushed or pulled at once, to stay under Notion's rate limits
+MAX_CONCURRENT_PAGES = 5
+
+# Maximum number of local files read or written at once
+MAX_CONCURRENT_FILES = min(32, (os.cpu_count() or 1) * 4)
+
+# Content objects are zstd-compressed, and named with this suffix, when zstandard is installed
+ZSTD_LEVEL = 3
+ZSTD_SUFFIX = ".zst"
+
+def map_concurrently(func, items, max_workers=MAX_CONCURRENT_PAGES):
+    """Apply func to each item in a bounded thread pool, returning results in item order"""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
 
-# Initialize rich console for better output formatting
-console = Console()
+# Characters not allowed in file names: anything other than letters, digits, space, ".", "-" and "_"
+UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w .-]')
+
+def sanitize_filename(title):
+    """Replace characters that are unsafe in file names with underscores"""
+    return UNSAFE_FILENAME_CHARS_RE.sub('_', title)
+
+def rich_text_property(value):
+    """Build a rich text database property from a front matter value"""
+    return {"rich_text": [{"text": {"content": value}}]}
+
+def multi_select_property(value):
+    """Build a multi-select database property from a comma-separated front matter value"""
+    return {"multi_select": [{"name": tag.strip()} for tag in value.split(",")]}
+
+# Front matter keys with special handling, by lowercased key, as (property name, builder).
+# Any other key becomes a rich text property of the same name.
+FRONT_MATTER_PROPERTIES = {
+    "tags": ("Tags", multi_select_property),
+}
+
+def config_version(stat):
+    """
+    Identify a version of the config file from its stat result
+    
+    The size catches rewrites within one coarse mtime tick, and the inode
+    catches same-size rewrites, since saves replace the file through a rename.
+    """
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
 
 class NotionSync:
     """Sync between local markdown files and Notion pages"""
     
     def __init__(self, api_key=None, page_id=None, database_id=None, config_dir=None):
         """Initialize the NotionSync"""
-        self.notion_client = NotionApiClient(api_key, page_id, database_id)
-        self.markdown_converter = MarkdownConverter()
         self.config_dir = config_dir or Path.home() / ".notionsync"
         self.ensure_directories()
+        self.notion_client = NotionApiClient(api_key, page_id, database_id, cache_dir=self.config_dir)
+        self.markdown_converter = MarkdownConverter()
     
     def ensure_directories(self):
         """Ensure the required directories exist"""
         self.config_dir.mkdir(parents=True, exist_ok=True)
     
     def load_config(self):
-        """Load config from config file"""
+        """Load config from config file
+        
+        The parsed config is cached and only read again when the file's
+        version (see config_version) changes.
+        """
         config_file = self.config_dir / "config.json"
-        if config_file.exists():
-            with open(config_file, "r") as f:
-                return json.load(f)
-        return {}
+        try:
+            stat = config_file.stat()
+        except FileNotFoundError:
+            return {}
+        
+        version = config_version(stat)
+        cached = _config_cache.get(config_file)
+        if cached is None or cached[0] != version:
+            cached = (version, read_json(config_file))
+            _config_cache[config_file] = cached
+        
+        # Callers may modify the returned config before saving it
+        return dict(cached[1])
     
     def save_config(self, config):
         """Save config to config file"""
         config_file = self.config_dir / "config.json"
-        with open(config_file, "w") as f:
-            json.dump(config, f, indent=2)
+        write_json(config_file, config, indent=True, atomic=True)
+        
+        # Cache what was just written, so a load in this process never sees an older config
+        stat = config_file.stat()
+        _config_cache[config_file] = (config_version(stat), dict(config))
+    
+    def get_commit_log(self, limit=None):
+        """Get a summary of every commit, newest first
+        
+        Args:
+            limit: Maximum number of commits to return, or None for all
+            
+        Returns:
+            list: Dicts with timestamp, message and file_count for each commit
+        """
+        return list(self.iter_commit_log(limit))
+    
+    def iter_commit_log(self, limit=None):
+        """Yield a summary of every commit, newest first
+        
+        Summaries are cached in commit_index.json keyed by commit filename and
+        mtime, so only new or changed commit files are parsed. Each summary is
+        yielded as soon as it is available, so callers can print as they go.
+        
+        Args:
+            limit: Maximum number of commits to yield, or None for all
+            
+        Yields:
+            dict: timestamp, message and file_count for a commit
+        """
+        commits_dir = self.config_dir / "commits"
+        index_file = self.config_dir / "commit_index.json"
+        
+        index = {}
+        if index_file.exists():
+            try:
+                index = read_json(index_file)
+            except ValueError:
+                index = {}
+        
+        with os.scandir(commits_dir) as entries:
+            all_entries = [entry for entry in entries if entry.name.endswith(".json")]
+        
+        # Commit filenames sort chronologically, so only the newest `limit` need ordering
+        if limit is None:
+            commit_entries = sorted(all_entries, key=attrgetter("name"), reverse=True)
+        else:
+            commit_entries = heapq.nlargest(limit, all_entries, key=attrgetter("name"))
+        
+        new_index = {}
+        try:
+            for entry in commit_entries:
+                mtime_ns = entry.stat().st_mtime_ns
+                cached = index.get(entry.name)
+                if not cached or cached["mtime_ns"] != mtime_ns:
+                    # Parse only commits that are new or changed since the last run
+                    commit_data = read_json(entry.path)
+                    cached = {
+                        "mtime_ns": mtime_ns,
+                        "timestamp": commit_data["timestamp"],
+                        "message": commit_data["message"],
+                        "file_count": len(commit_data["files"])
+                    }
+                
+                new_index[entry.name] = cached
+                yield cached
+        finally:
+            # Keep entries not reached if the caller stopped early or a limit was set
+            if len(new_index) < len(all_entries):
+                names = {entry.name for entry in all_entries}
+                for name, cached in index.items():
+                    if name in names:
+                        new_index.setdefault(name, cached)
+            
+            if new_index != index:
+                # Write atomically so an interrupted run never leaves a corrupt index
+                write_json(index_file, new_index, atomic=True)
     
     def get_markdown_files(self):
-        """Get all markdown files in the current directory"""
-        return list(Path(".").glob("**/*.md"))
+        """Get the paths of all markdown files in the current directory, as strings"""
+        return [path for path, _ in self._walk_markdown_files()]
+    
+    def _walk_markdown_files(self, directory="."):
+        """
+        Recursively find markdown files with os.scandir
+        
+        Args:
+            directory: The directory to search
+            
+        Yields:
+            tuple: (path, stat_result) for each markdown file, paths relative to the current directory
+        """
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            # Skip directories that cannot be read, as Path.glob does
+            return
+        
+        with entries:
+            for entry in entries:
+                # Symlinked directories are not followed, so a link back up the tree cannot loop forever
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._walk_markdown_files(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    # One stat call per markdown file on POSIX; Windows fills it in from the directory listing
+                    yield os.path.normpath(entry.path), entry.stat()
     
     def create_index_md_if_missing(self):
         """Create an index.md file if it doesn't exist"""
         index_path = Path("index.md")
         if not index_path.exists():
             console.print("[yellow]Creating index.md file...[/yellow]")
-            with open(index_path, "w") as f:
-                f.write("# NotionSync Project\n\nThis is the main page of your NotionSync project.\n")
+            index_path.write_text("# NotionSync Project\n\nThis is the main page of your NotionSync project.\n")
             console.print("[green]Created index.md file[/green]")
     
     def commit(self, message):
-        """Commit changes to local storage"""
+        """Commit changes to local storage
+        
+        File contents go to the content-addressed object store and the commit
+        itself is a small manifest of paths and content hashes.
+        """
         # Get current state of markdown files
-        files = self.get_markdown_files()
+        files = list(self._walk_markdown_files())
+        
+        # Entries from the last commit, reused for files that have not changed since
+        last_entries = self._last_commit_entries()
         
         # Prepare commit data
+        now = datetime.now()
         commit_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "message": message,
-            "files": []
+            # Files are read, hashed and stored concurrently so disk I/O overlaps
+            "files": map_concurrently(
+                lambda file: self._commit_file(file, last_entries),
+                files,
+                max_workers=MAX_CONCURRENT_FILES
+            )
         }
         
-        # Record file contents
-        for file_path in files:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                commit_data["files"].append({
-                    "path": str(file_path),
-                    "content": content
-                })
-        
         # Save commit to file
         commits_dir = self.config_dir / "commits"
         commits_dir.mkdir(exist_ok=True)
-        commit_file = commits_dir / f"{commit_data['timestamp'].replace(':', '-')}.json"
+        # Compact timestamps sort chronologically by filename, after any older ISO-named commits
+        commit_file = commits_dir / f"{now:%Y%m%dT%H%M%S%f}.json"
         
-        with open(commit_file, "w", encoding="utf-8") as f:
-            json.dump(commit_data, f, indent=2)
+        # Commits are written atomically and flushed, so a crash never leaves a truncated commit
+        write_json(commit_file, commit_data, atomic=True, fsync=True)
         
         # Update last commit pointer
         config = self.load_config()
         config["last_commit"] = commit_data["timestamp"]
+        config["last_commit_file"] = commit_file.name
         self.save_config(config)
         
         console.print(f"[green]Committed {len(files)} files with message: {message}[/green]")
         return commit_data
     
+    def _last_commit_entries(self):
+        """Get the file entries of the last commit, keyed by path"""
+        config = self.load_config()
+        if "last_commit" not in config:
+            return {}
+        
+        commit_file = self.get_last_commit_file(config)
+        if not commit_file.exists():
+            return {}
+        
+        return {file_data["path"]: file_data for file_data in self.load_commit(commit_file)["files"]}
+    
+    def _commit_file(self, file, last_entries):
+        """
+        Store a file's content in the object store and describe it for a commit
+        
+        Args:
+            file: A (path, stat) pair for the file
+            last_entries: The last commit's file entries, keyed by path
+            
+        Returns:
+            dict: The file's commit entry
+        """
+        file_path, stat = file
+        
+        # A file whose size and mtime match the last commit is unchanged and is not read
+        last_entry = last_entries.get(file_path)
+        if (last_entry and "hash" in last_entry
+                and last_entry.get("mtime_ns") == stat.st_mtime_ns
+                and last_entry.get("size") == stat.st_size
+                and self.find_object(last_entry["hash"]) is not None):
+            return last_entry
+        
+        data = Path(file_path).read_bytes()
+        return {
+            "path": file_path,
+            "hash": self.write_object(data),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size
+        }
+    
+    def get_last_commit_file(self, config):
+        """Get the path of the last commit's file from the config"""
+        if "last_commit_file" in config:
+            return self.config_dir / "commits" / config["last_commit_file"]
+        # Commits made before last_commit_file was recorded are named after their timestamp
+        return self.config_dir / "commits" / f"{config['last_commit'].replace(':', '-')}.json"
+    
+    def load_commit(self, commit_file):
+        """
+        Load a commit manifest
+        
+        File contents are not loaded; use read_file_content for each file as it is needed.
+        
+        Args:
+            commit_file: Path to the commit file
+            
+        Returns:
+            dict: The commit data
+        """
+        return read_json(commit_file)
+    
+    def read_file_content(self, file_data):
+        """Get the content of a file entry from a commit"""
+        # Commits made before the object store keep their content inline
+        if "content" in file_data:
+            return file_data["content"]
+        return self.read_object(file_data["hash"])
+    
+    def write_object(self, data):
+        """
+        Store file content in the object store
+        
+        Objects are zstd-compressed when zstandard is installed (the zstd extra).
+        
+        Args:
+            data: The file content as bytes
+            
+        Returns:
+            str: The content hash the object is stored under
+        """
+        content_hash = hash_content(data)
+        
+        # Content already stored by an earlier commit is not rewritten
+        if self.find_object(content_hash) is None:
+            objects_dir = self.config_dir / "objects"
+            objects_dir.mkdir(exist_ok=True)
+            if zstandard is not None:
+                write_file_atomic(
+                    objects_dir / f"{content_hash}{ZSTD_SUFFIX}",
+                    zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data),
+                    fsync=True
+                )
+            else:
+                write_file_atomic(objects_dir / content_hash, data, fsync=True)
+        
+        return content_hash
+    
+    def find_object(self, content_hash):
+        """Get the path of a stored object, compressed or not, or None if it is not stored"""
+        objects_dir = self.config_dir / "objects"
+        for object_file in (objects_dir / f"{content_hash}{ZSTD_SUFFIX}", objects_dir / content_hash):
+            if object_file.exists():
+                return object_file
+        return None
+    
+    def read_object(self, content_hash):
+        """Read file content from the object store"""
+        object_file = self.find_object(content_hash)
+        if object_file is None:
+            raise FileNotFoundError(f"Object not found: {content_hash}")
+        
+        data = object_file.read_bytes()
+        if object_file.name.endswith(ZSTD_SUFFIX):
+            if zstandard is None:
+                raise RuntimeError(
+                    f"{object_file} is zstd-compressed but the zstandard package is not installed; "
+                    "install it with: pip install notionsync[zstd]"
+                )
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return data.decode("utf-8")
+    
     def push(self):
         """Push committed changes to Notion"""
         # Load config to get last commit
@@ -104,15 +397,13 @@ class NotionSync:
             return False
         
         # Load the last commit
-        last_commit = config["last_commit"]
-        commit_file = self.config_dir / "commits" / f"{last_commit.replace(':', '-')}.json"
+        commit_file = self.get_last_commit_file(config)
         
         if not commit_file.exists():
             console.print(f"[bold red]Commit file not found: {commit_file}[/bold red]")
             return False
         
-        with open(commit_file, "r", encoding="utf-8") as f:
-            commit_data = json.load(f)
+        commit_data = self.load_commit(commit_file)
         
         # Determine if we're pushing to a database or a page
         if self.notion_client.database_id:
@@ -130,94 +421,108 @@ class NotionSync:
             console.print("[bold red]Database ID not set. Please set NOTION_DATABASE_ID in your .env file.[/bold red]")
             return False
         
-        # Process each file in the commit
-        success_count = 0
-        for file_data in commit_data["files"]:
-            file_path = file_data["path"]
-            content = file_data["content"]
+        # Look up existing entries once, instead of querying the database for each file
+        try:
+            existing_pages = self._get_database_pages_by_title()
+        except Exception as e:
+            console.print(f"[bold red]Error reading existing database entries: {e}[/bold red]")
+            return False
+        
+        # Push files concurrently; each file is created or updated independently
+        file_results = map_concurrently(
+            lambda file_data: self._push_file_to_database(file_data, existing_pages),
+            [file_data for file_data in commit_data["files"] if file_data["path"] != "index.md"]
+        )
+        success_count = sum(1 for result in file_results if result)
+        
+        if success_count > 0:
+            console.print(f"[green]Successfully pushed {success_count} files to Notion database[/green]")
+            return True
+        else:
+            console.print("[bold red]No files were pushed to the database.[/bold red]")
+            return False
+    
+    def _get_database_pages_by_title(self):
+        """
+        Get the IDs of all entries in the Notion database, keyed by their Name
+        
+        Returns:
+            dict: {title: page_id}, keeping the first entry for duplicate titles
+        """
+        existing_pages = {}
+        for entry in self.notion_client.query_database_all(self.notion_client.database_id):
+            name = entry.get("properties", {}).get("Name", {})
+            title = "".join(text["plain_text"] for text in name.get("title", []))
+            existing_pages.setdefault(title, entry["id"])
+        return existing_pages
+    
+    def _push_file_to_database(self, file_data, existing_pages):
+        """
+        Push a single committed file to the Notion database
+        
+        Args:
+            file_data: The file's entry from the commit data
+            existing_pages: IDs of the database's existing entries, keyed by title
             
-            # Skip index.md for database pushes
-            if file_path == "index.md":
-                continue
+        Returns:
+            bool: Whether the file was pushed
+        """
+        file_path = file_data["path"]
+        
+        try:
+            # Read the content only now, so only files being pushed are held in memory
+            content = self.read_file_content(file_data)
             
-            try:
-                # Extract front matter and content
-                front_matter, markdown_content = extract_front_matter(content)
-                
-                # Skip files without front matter in database mode
-                if not front_matter:
-                    console.print(f"[yellow]Skipping {file_path} - No front matter found (required for database entries)[/yellow]")
-                    continue
-                
-                # Get page title from filename (without extension)
-                page_title = Path(file_path).stem
-                
-                # Create properties for database
-                properties = {
-                    "Name": {"title": [{"text": {"content": page_title}}]}
-                }
-                
-                # Add front matter as properties
-                for key, value in front_matter.items():
-                    # Handle tags specially (as multi-select)
-                    if key.lower() == "tags":
-                        tags = [tag.strip() for tag in value.split(",")]
-                        properties["Tags"] = {
-                            "multi_select": [{"name": tag} for tag in tags]
-                        }
-                    else:
-                        # For other properties, add as rich text
-                        properties[key] = {
-                            "rich_text": [{"text": {"content": value}}]
-                        }
-                
-                # Convert markdown to Notion blocks
-                blocks = self.markdown_converter.markdown_to_notion_blocks(markdown_content)
-                
-                # Check if entry already exists in database by name
-                query_filter = {
-                    "property": "Name",
-                    "title": {
-                        "equals": page_title
-                    }
-                }
+            # Extract front matter and content
+            front_matter, markdown_content = extract_front_matter(content)
+            
+            # Skip files without front matter in database mode
+            if not front_matter:
+                console.print(f"[yellow]Skipping {file_path} - No front matter found (required for database entries)[/yellow]")
+                return False
+            
+            # Get page title from filename (without extension)
+            page_title = Path(file_path).stem
+            
+            # Create properties for database
+            properties = {
+                "Name": {"title": [{"text": {"content": page_title}}]}
+            }
+            
+            # Add front matter as properties
+            for key, value in front_matter.items():
+                property_name, build_property = FRONT_MATTER_PROPERTIES.get(key.lower(), (key, rich_text_property))
+                properties[property_name] = build_property(value)
+            
+            # Convert markdown to Notion blocks
+            blocks = self.markdown_converter.markdown_to_notion_blocks(markdown_content)
+            
+            # Check if entry already exists in database by name
+            page_id = existing_pages.get(page_title)
+            
+            if page_id:
+                # Update existing entry
+                console.print(f"[yellow]Updating existing page in database: {page_title}[/yellow]")
                 
-                # Query the database
-                query_result = self.notion_client.query_database(
-                    self.notion_client.database_id,
-                    filter=query_filter
-                )
+                # First, clear existing content
+                # (In a real implementation, we would handle this more gracefully)
                 
-                if query_result["results"]:
-                    # Update existing entry
-                    page_id = query_result["results"][0]["id"]
-                    console.print(f"[yellow]Updating existing page in database: {page_title}[/yellow]")
-                    
-                    # First, clear existing content
-                    # (In a real implementation, we would handle this more gracefully)
-                    
-                    # Update properties and content
-                    self.notion_client.update_page(page_id, properties, blocks)
-                else:
-                    # Create new entry
-                    console.print(f"[yellow]Creating new page in database: {page_title}[/yellow]")
-                    
-                    # Set parent to database
-                    parent = {"database_id": self.notion_client.database_id}
-                    
-                    # Create page
-                    self.notion_client.create_page(parent, properties, blocks)
+                # Update properties and content
+                self.notion_client.update_page(page_id, properties, blocks)
+            else:
+                # Create new entry
+                console.print(f"[yellow]Creating new page in database: {page_title}[/yellow]")
                 
-                success_count += 1
+                # Set parent to database
+                parent = {"database_id": self.notion_client.database_id}
                 
-            except Exception as e:
-                console.print(f"[bold red]Error pushing {file_path} to database: {e}[/bold red]")
-        
-        if success_count > 0:
-            console.print(f"[green]Successfully pushed {success_count} files to Notion database[/green]")
+                # Create page
+                self.notion_client.create_page(parent, properties, blocks)
+            
             return True
-        else:
-            console.print("[bold red]No files were pushed to the database.[/bold red]")
+        
+        except Exception as e:
+            console.print(f"[bold red]Error pushing {file_path} to database: {e}[/bold red]")
             return False
     
     def push_to_page(self, commit_data, index_path):
@@ -237,22 +542,17 @@ class NotionSync:
             # In a real implementation, we would handle this more gracefully (e.g., diff and update)
             
             # First, push the index.md file to the main content
-            index_file = None
-            child_pages = []
-            
-            # Find index.md and other files in commit data
-            for file_data in commit_data["files"]:
-                if file_data["path"] == "index.md":
-                    index_file = file_data
-                else:
-                    child_pages.append(file_data)
+            # Separate index.md from the other files in commit data by path
+            files_by_path = {file_data["path"]: file_data for file_data in commit_data["files"]}
+            index_file = files_by_path.pop("index.md", None)
+            child_pages = list(files_by_path.values())
             
             # Push index.md content to the main page
             if index_file:
                 console.print("[yellow]Updating main page content from index.md...[/yellow]")
                 
                 # Convert markdown to Notion blocks
-                blocks = self.markdown_converter.markdown_to_notion_blocks(index_file["content"])
+                blocks = self.markdown_converter.markdown_to_notion_blocks(self.read_file_content(index_file))
                 
                 # Update page content
                 self.notion_client.update_page(self.notion_client.page_id, None, blocks)
@@ -260,7 +560,7 @@ class NotionSync:
             # Create child pages for other markdown files
             for child_page_data in child_pages:
                 file_path = child_page_data["path"]
-                content = child_page_data["content"]
+                content = self.read_file_content(child_page_data)
                 
                 # Get page title from filename (without extension)
                 page_title = Path(file_path).stem
@@ -320,11 +620,16 @@ class NotionSync:
             db_dir = Path("notion_db")
             db_dir.mkdir(exist_ok=True)
             
-            # Process each database entry
-            for entry in query_result["results"]:
-                # Get page ID and title
-                page_id = entry["id"]
-                
+            # Fetch the content of all entries concurrently
+            entries = query_result["results"]
+            entry_contents = map_concurrently(
+                lambda entry: self.notion_client.get_page_content(entry["id"], entry.get("last_edited_time")),
+                entries
+            )
+            
+            # Process each database entry, collecting file contents by path
+            pulled_files = {}
+            for entry, page_content in zip(entries, entry_contents):
                 # Get page title from Name property
                 page_title = "untitled"
                 if "properties" in entry and "Name" in entry["properties"]:
@@ -333,10 +638,7 @@ class NotionSync:
                         page_title = title_data[0]["plain_text"]
                 
                 # Sanitize title for filename
-                safe_title = "".join(c if c.isalnum() or c in [' ', '.', '-', '_'] else '_' for c in page_title)
-                
-                # Get page content
-                page_content = self.notion_client.get_page_content(page_id)
+                safe_title = sanitize_filename(page_title)
                 
                 # Convert blocks to markdown
                 markdown_content = self.markdown_converter.notion_blocks_to_markdown(page_content)
@@ -368,11 +670,16 @@ class NotionSync:
                     front_matter_str += f"{key}: {value}\n"
                 front_matter_str += "---\n\n"
                 
-                # Save to file
-                file_path = db_dir / f"{safe_title}.md"
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(front_matter_str + markdown_content)
-                
+                # Entries with the same title are saved to the same file, and the last one wins
+                pulled_files[db_dir / f"{safe_title}.md"] = front_matter_str + markdown_content
+            
+            # Save all files concurrently
+            map_concurrently(
+                lambda item: item[0].write_text(item[1], encoding="utf-8"),
+                pulled_files.items(),
+                max_workers=MAX_CONCURRENT_FILES
+            )
+            for file_path in pulled_files:
                 console.print(f"[green]Saved {file_path}[/green]")
             
             console.print(f"[green]Successfully pulled {len(query_result['results'])} entries from database[/green]")
@@ -392,12 +699,12 @@ class NotionSync:
             return False
         
         try:
-            # Get page content
-            page_content = self.notion_client.get_page_content(self.notion_client.page_id)
-            
             # Get page metadata
             page = self.notion_client.get_page(self.notion_client.page_id)
             
+            # Get page content
+            page_content = self.notion_client.get_page_content(self.notion_client.page_id, page.get("last_edited_time"))
+            
             # Get page title
             page_title = "Notion Page"
             if "properties" in page and "title" in page["properties"]:
@@ -409,8 +716,7 @@ class NotionSync:
             markdown_content = self.markdown_converter.notion_blocks_to_markdown(page_content)
             
             # Save to index.md
-            with open("index.md", "w", encoding="utf-8") as f:
-                f.write(f"# {page_title}\n\n{markdown_content}")
+            Path("index.md").write_text(f"# {page_title}\n\n{markdown_content}", encoding="utf-8")
             
             console.print(f"[green]Saved main page content to index.md[/green]")
             
@@ -440,24 +746,26 @@ class NotionSync:
         child_pages = self.notion_client.get_child_pages(parent_page_id)
         total_pages = len(child_pages)
         
+        # Fetch the content of all child pages at this level concurrently
+        child_contents = map_concurrently(
+            lambda child_page: self.notion_client.get_page_content(child_page["id"], child_page.get("last_edited_time")),
+            child_pages
+        )
+        
         # Process each child page
-        for child_page in child_pages:
+        for child_page, child_content in zip(child_pages, child_contents):
             child_id = child_page["id"]
             child_title = child_page["properties"]["title"]["title"][0]["plain_text"]
             
             # Sanitize title for filename
-            safe_title = "".join(c if c.isalnum() or c in [' ', '.', '-', '_'] else '_' for c in child_title)
+            safe_title = sanitize_filename(child_title)
             file_name = f"{prefix}{safe_title}.md"
             
-            # Get child page content
-            child_content = self.notion_client.get_page_content(child_id)
-            
             # Convert blocks to markdown
             child_markdown = self.markdown_converter.notion_blocks_to_markdown(child_content)
             
             # Save to file
-            with open(file_name, "w", encoding="utf-8") as f:
-                f.write(f"# {child_title}\n\n{child_markdown}")
+            Path(file_name).write_text(f"# {child_title}\n\n{child_markdown}", encoding="utf-8")
             
             console.print(f"[green]Saved child page {child_title} to {file_name}[/green]")
             
@@ -481,12 +789,11 @@ class NotionSync:
             files = self.get_markdown_files()
             return {
                 "no_commits": True,
-                "all_files": [str(f) for f in files]
+                "all_files": files
             }
         
         # Load the last commit
-        last_commit = config["last_commit"]
-        commit_file = self.config_dir / "commits" / f"{last_commit.replace(':', '-')}.json"
+        commit_file = self.get_last_commit_file(config)
         
         if not commit_file.exists():
             return {
@@ -494,20 +801,33 @@ class NotionSync:
             }
         
         # Load commit data
-        with open(commit_file, "r", encoding="utf-8") as f:
-            commit_data = json.load(f)
+        commit_data = self.load_commit(commit_file)
         
-        # Create a dictionary of last committed files
-        last_commit_files = {}
+        # Get current files
+        current_stats = dict(self._walk_markdown_files())
+        current_files = [Path(path) for path in current_stats]
+        
+        # Files whose size and mtime match the commit are unchanged and are not read
+        unchanged = set()
         for file_data in commit_data["files"]:
-            last_commit_files[file_data["path"]] = file_data["content"]
+            stat = current_stats.get(file_data["path"])
+            if (stat and "mtime_ns" in file_data
+                    and stat.st_mtime_ns == file_data["mtime_ns"]
+                    and stat.st_size == file_data["size"]):
+                unchanged.add(file_data["path"])
         
-        # Get current files
-        current_files = self.get_markdown_files()
+        # Create a dictionary of last committed file hashes
+        last_commit_files = {}
+        for file_data in commit_data["files"]:
+            if "hash" in file_data:
+                last_commit_files[file_data["path"]] = file_data["hash"]
+            else:
+                # Commits made before the object store keep their content inline
+                last_commit_files[file_data["path"]] = hash_content(file_data["content"].encode("utf-8"))
         
-        # Compare files
+        # Compare files by content hash
         from ..utils.helpers import get_file_changes
-        changes = get_file_changes(last_commit_files, current_files)
+        changes = get_file_changes(last_commit_files, current_files, unchanged)
         
         # Add in last commit info
         changes["changes_since_last_commit"] = any(changes.values())
@@ -5,8 +5,113 @@ This module handles the conversion of Markdown content to Notion blocks and vice
 """
 
 import re
-import mistune
-from mistletoe import Document
+
+# Classifies a line as a heading, to-do, bullet or numbered list item in one match.
+# Alternatives are tried in order, so headings win over list items as before.
+LINE_RE = re.compile(
+    r'(?P<heading_1># )|(?P<heading_2>## )|(?P<heading_3>### )'
+    r'|(?P<to_do>(?P<todo_indent>\s*)- \[(?P<checked>[ x])\] (?P<todo_content>.*))'
+    r'|(?P<bulleted_list_item>(?P<bullet_indent>\s*)- (?P<bullet_content>.*))'
+    r'|(?P<numbered_list_item>(?P<number_indent>\s*)\d+\.\s(?P<number_content>.*))'
+)
+
+# Notionが受け入れる言語リスト
+VALID_NOTION_LANGUAGES = frozenset([
+    "abap", "agda", "arduino", "ascii art", "assembly", "bash", "basic", "bnf", 
+    "c", "c#", "c++", "clojure", "coffeescript", "coq", "css", "dart", "dhall", 
+    "diff", "docker", "ebnf", "elixir", "elm", "erlang", "f#", "flow", "fortran", 
+    "gherkin", "glsl", "go", "graphql", "groovy", "haskell", "hcl", "html", "idris", 
+    "java", "javascript", "json", "julia", "kotlin", "latex", "less", "lisp", 
+    "livescript", "llvm ir", "lua", "makefile", "markdown", "markup", "matlab", 
+    "mathematica", "mermaid", "nix", "notion formula", "objective-c", "ocaml", 
+    "pascal", "perl", "php", "plain text", "powershell", "prolog", "protobuf", 
+    "purescript", "python", "r", "racket", "reason", "ruby", "rust", "sass", 
+    "scala", "scheme", "scss", "shell", "smalltalk", "solidity", "sql", "swift", 
+    "toml", "typescript", "vb.net", "verilog", "vhdl", "visual basic", 
+    "webassembly", "xml", "yaml", "java/c/c++/c#", "notionscript"
+])
+
+# 共通のプログラミング言語マッピング
+LANGUAGE_MAPPING = {
+    "js": "javascript",
+    "py": "python",
+    "ts": "typescript",
+    "cs": "c#",
+    "sh": "shell",
+    "rb": "ruby",
+    "yml": "yaml",
+    "": "plain text"
+}
+
+# Notion language names by lowercased fence language, including the abbreviations above
+NOTION_LANGUAGE_NAMES = {**{language: language for language in VALID_NOTION_LANGUAGES}, **LANGUAGE_MAPPING}
+
+
+# Markdown markers for Notion annotations, innermost first.
+# Markdown doesn't have underline, so it is approximated with emphasis.
+ANNOTATION_MARKERS = (
+    ("bold", "**"),
+    ("italic", "*"),
+    ("strikethrough", "~~"),
+    ("code", "`"),
+    ("underline", "_"),
+)
+
+# Inline formatting, matched left to right in a single scan. Bold is tried before
+# italic, so "**" at a position is read as bold whenever it closes.
+INLINE_RE = re.compile(
+    r'(?P<bold>\*\*(?P<bold_content>.*?)\*\*)'
+    r'|(?P<italic>\*(?P<italic_content>.*?)\*)'
+    r'|(?P<code>`(?P<code_content>.*?)`)'
+    r'|(?P<link>\[(?P<link_content>.*?)\]\((?P<link_url>.*?)\))'
+    r'|(?P<strikethrough>~~(?P<strikethrough_content>.*?)~~)'
+)
+
+# Matches a table cell in a header separator row, e.g. "---", ":--" or ":-:"
+SEPARATOR_CELL_RE = re.compile(r'^:?-+:?$')
+
+# Splits a table row into text, backslash escapes and cell separators
+TABLE_ROW_TOKEN_RE = re.compile(r'(\\.?|\|)', re.DOTALL)
+
+def split_table_row(row_content):
+    """
+    Split the inside of a Markdown table row into stripped cell texts
+    
+    A backslash escapes the next character, so "\\|" is a literal pipe. A
+    trailing separator does not start another cell, unless text follows it.
+    """
+    if '\\' not in row_content:
+        # No escapes: a plain split does the whole job
+        parts = row_content.split('|')
+        cells = [part.strip() for part in parts[:-1]]
+        if parts[-1]:
+            cells.append(parts[-1].strip())
+        return cells
+    
+    cells = []
+    current_cell = []
+    for token in TABLE_ROW_TOKEN_RE.split(row_content):
+        if token == '|':
+            cells.append("".join(current_cell).strip())
+            current_cell = []
+        elif token.startswith('\\'):
+            current_cell.append(token[1:])
+        else:
+            current_cell.append(token)
+    
+    # Add the last cell
+    last_cell = "".join(current_cell)
+    if last_cell:
+        cells.append(last_cell.strip())
+    return cells
+
+def plain_text(content):
+    """Build a rich text array holding a single run of unformatted text"""
+    return [{"type": "text", "text": {"content": content}}]
+
+def text_block(block_type, rich_text, **fields):
+    """Build a Notion block of the given type from its rich text and any extra fields"""
+    return {"object": "block", "type": block_type, block_type: {"rich_text": rich_text, **fields}}
 
 class MarkdownConverter:
     """Converts between Markdown content and Notion blocks"""
@@ -42,47 +147,25 @@ class MarkdownConverter:
     def basic_markdown_to_blocks(self, markdown_content):
         """Convert Markdown content to basic Notion blocks"""
         blocks = []
-        lines = markdown_content.split('\n')
+        # Bound once, since blocks are appended for nearly every line
+        add_block = blocks.append
+        # Windows line endings are normalized, so no stray "\r" ends up in code or callout text.
+        # Only "\n" separates lines; unlike splitlines(), form feeds and other separators stay in the text.
+        lines = markdown_content.replace('\r\n', '\n').split('\n')
+        if lines[-1] == "":
+            lines.pop()
         
         i = 0
         in_code_block = False
-        code_block_content = ""
+        code_block_lines = []
         code_language = ""
         
-        # Notionが受け入れる言語リスト
-        valid_notion_languages = [
-            "abap", "agda", "arduino", "ascii art", "assembly", "bash", "basic", "bnf", 
-            "c", "c#", "c++", "clojure", "coffeescript", "coq", "css", "dart", "dhall", 
-            "diff", "docker", "ebnf", "elixir", "elm", "erlang", "f#", "flow", "fortran", 
-            "gherkin", "glsl", "go", "graphql", "groovy", "haskell", "hcl", "html", "idris", 
-            "java", "javascript", "json", "julia", "kotlin", "latex", "less", "lisp", 
-            "livescript", "llvm ir", "lua", "makefile", "markdown", "markup", "matlab", 
-            "mathematica", "mermaid", "nix", "notion formula", "objective-c", "ocaml", 
-            "pascal", "perl", "php", "plain text", "powershell", "prolog", "protobuf", 
-            "purescript", "python", "r", "racket", "reason", "ruby", "rust", "sass", 
-            "scala", "scheme", "scss", "shell", "smalltalk", "solidity", "sql", "swift", 
-            "toml", "typescript", "vb.net", "verilog", "vhdl", "visual basic", 
-            "webassembly", "xml", "yaml", "java/c/c++/c#", "notionscript"
-        ]
-        
-        # 共通のプログラミング言語マッピング
-        language_mapping = {
-            "js": "javascript",
-            "py": "python",
-            "ts": "typescript",
-            "cs": "c#",
-            "sh": "shell",
-            "rb": "ruby",
-            "yml": "yaml",
-            "": "plain text"
-        }
-        
         in_blockquote = False
-        blockquote_content = ""
+        blockquote_lines = []
         
         # Check for callout blocks
         in_callout = False
-        callout_content = ""
+        callout_lines = []
         callout_emoji = "💡"  # Default emoji
         
         # Table parsing variables
@@ -92,57 +175,39 @@ class MarkdownConverter:
         
         while i < len(lines):
             line = lines[i]
+            # Strip once; most checks below look at the stripped line
+            stripped = line.strip()
             
             # Handle tables
-            if line.strip().startswith('|') and line.strip().endswith('|'):
+            if stripped.startswith('|') and stripped.endswith('|'):
                 if not in_table:
                     # Start of table
                     in_table = True
                     table_rows = []
                 
-                # Process this row
-                row_content = line.strip()[1:-1]  # Remove leading and trailing |
-                
-                # Split by pipes (accounting for escaped pipes)
-                row_cells = []
-                current_cell = ""
-                escape_next = False
-                for char in row_content:
-                    if escape_next:
-                        current_cell += char
-                        escape_next = False
-                    elif char == '\\':
-                        escape_next = True
-                    elif char == '|':
-                        row_cells.append(current_cell.strip())
-                        current_cell = ""
+                # Process the whole run of consecutive table rows in one pass
+                while True:
+                    # Split by pipes (accounting for escaped pipes), without the leading and trailing |
+                    row_cells = split_table_row(stripped[1:-1])
+                    
+                    # A header separator row contains only dashes and maybe colons
+                    if all(cell == '' or SEPARATOR_CELL_RE.match(cell) for cell in row_cells):
+                        # If we encounter a separator row, mark the previous row as a header
+                        if table_rows:
+                            table_has_header = True
                     else:
-                        current_cell += char
-                
-                # Add the last cell
-                if current_cell:
-                    row_cells.append(current_cell.strip())
-                
-                # Check if this is a header separator row (contains only dashes and maybe colons)
-                is_separator = True
-                for cell in row_cells:
-                    if not (cell.strip() == '' or 
-                            re.match(r'^:?-+:?$', cell.strip())):
-                        is_separator = False
+                        # Only add actual content rows (not separators)
+                        table_rows.append(row_cells)
+                    
+                    i += 1
+                    if i >= len(lines):
+                        break
+                    stripped = lines[i].strip()
+                    if not (stripped.startswith('|') and stripped.endswith('|')):
                         break
-                
-                if is_separator:
-                    # If we encounter a separator row, mark the previous row as a header
-                    if table_rows:
-                        table_has_header = True
-                else:
-                    # Only add actual content rows (not separators)
-                    table_rows.append(row_cells)
-                
-                i += 1
                 
                 # Check if this is the end of the table (no more table rows)
-                if i >= len(lines) or not lines[i].strip().startswith('|'):
+                if i >= len(lines) or not stripped.startswith('|'):
                     in_table = False
                     
                     # Process the table
@@ -166,7 +231,7 @@ class MarkdownConverter:
                             for cell in row_cells:
                                 rich_text = self.process_inline_formatting(cell)
                                 if not rich_text:
-                                    rich_text = [{"type": "text", "text": {"content": cell}}]
+                                    rich_text = plain_text(cell)
                                 rich_text_cells.append(rich_text)
                             
                             # Create row block
@@ -180,400 +245,226 @@ class MarkdownConverter:
                             
                             table_block["children"].append(row_block)
                         
-                        blocks.append(table_block)
+                        add_block(table_block)
                     
                 continue
             
             # Handle callout blocks (AdmonitionExtension style)
-            if line.strip().startswith('::: callout'):
+            if stripped.startswith('::: callout'):
                 if not in_callout:
                     # Start of callout
                     in_callout = True
-                    callout_content = ""
+                    callout_lines = []
                     
                     # Extract emoji if provided
-                    parts = line.strip()[11:].strip().split(' ', 1)
+                    parts = stripped[11:].strip().split(' ', 1)
                     if parts and parts[0]:
                         callout_emoji = parts[0]
                     
                     i += 1
                     continue
-            elif in_callout and line.strip() == ':::':
+            elif in_callout and stripped == ':::':
                 # End of callout
                 in_callout = False
-                blocks.append({
-                    "object": "block",
-                    "type": "callout",
-                    "callout": {
-                        "rich_text": [{"type": "text", "text": {"content": callout_content.strip()}}],
-                        "icon": {
-                            "type": "emoji",
-                            "emoji": callout_emoji
-                        },
-                        "color": "gray_background"
-                    }
-                })
+                add_block(text_block(
+                "callout",
+                plain_text("\n".join(callout_lines).strip()),
+                icon={"type": "emoji", "emoji": callout_emoji},
+                color="gray_background"
+            ))
                 i += 1
                 continue
             elif in_callout:
                 # Inside callout - remove indentation if it exists
                 if line.startswith('    '):
-                    callout_content += line[4:] + "\n"
+                    callout_lines.append(line[4:])
                 else:
-                    callout_content += line + "\n"
+                    callout_lines.append(line)
                 i += 1
                 continue
             
             # Handle code blocks
-            if line.strip().startswith('```'):
+            if stripped.startswith('```'):
                 if not in_code_block:
                     # Start of code block
                     in_code_block = True
-                    code_block_content = ""
+                    code_block_lines = []
                     # Extract language if specified
-                    if len(line.strip()) > 3:
-                        code_language = line.strip()[3:].strip()
-                        # Map common language abbreviations
-                        if code_language in language_mapping:
-                            code_language = language_mapping[code_language]
-                        # Ensure language is valid for Notion
-                        if code_language not in valid_notion_languages:
-                            # Default to plain text if language is not supported
-                            code_language = "plain text"
+                    if len(stripped) > 3:
+                        # Map common language abbreviations, case-insensitively, and
+                        # default to plain text if language is not supported by Notion
+                        code_language = NOTION_LANGUAGE_NAMES.get(stripped[3:].strip().lower(), "plain text")
                 else:
                     # End of code block
                     in_code_block = False
-                    blocks.append({
-                        "object": "block",
-                        "type": "code",
-                        "code": {
-                            "rich_text": [{"type": "text", "text": {"content": code_block_content.rstrip()}}],
-                            "language": code_language if code_language else "plain text"
-                        }
-                    })
+                    add_block(text_block(
+                        "code",
+                        plain_text("\n".join(code_block_lines).rstrip()),
+                        language=code_language if code_language else "plain text"
+                    ))
                 i += 1
                 continue
                 
             if in_code_block:
-                code_block_content += line + "\n"
+                code_block_lines.append(line)
                 i += 1
                 continue
             
             # Handle blockquotes
-            if line.strip().startswith('> '):
+            if stripped.startswith('> '):
                 if not in_blockquote:
                     # Start of blockquote
                     in_blockquote = True
-                    blockquote_content = line.strip()[2:] + "\n"
+                    blockquote_lines = [stripped[2:]]
                 else:
                     # Continue blockquote
-                    if line.strip() == '>':
-                        blockquote_content += "\n"
+                    if stripped == '>':
+                        blockquote_lines.append("")
                     else:
-                        blockquote_content += line.strip()[2:] + "\n"
+                        blockquote_lines.append(stripped[2:])
                 i += 1
                 continue
-            elif in_blockquote and line.strip() == '':
+            elif in_blockquote and stripped == '':
                 # Empty line might continue a blockquote, check next line
                 if i + 1 < len(lines) and lines[i + 1].strip().startswith('> '):
-                    blockquote_content += "\n"
+                    blockquote_lines.append("")
                     i += 1
                     continue
                 else:
                     # End of blockquote
                     in_blockquote = False
-                    blocks.append({
-                        "object": "block",
-                        "type": "quote",
-                        "quote": {
-                            "rich_text": [{"type": "text", "text": {"content": blockquote_content.strip()}}]
-                        }
-                    })
+                    add_block(text_block("quote", plain_text("\n".join(blockquote_lines).strip())))
             elif in_blockquote:
                 # End of blockquote reached
                 in_blockquote = False
-                blocks.append({
-                    "object": "block",
-                    "type": "quote",
-                    "quote": {
-                        "rich_text": [{"type": "text", "text": {"content": blockquote_content.strip()}}]
-                    }
-                })
+                add_block(text_block("quote", plain_text("\n".join(blockquote_lines).strip())))
+            
+            # Classify headings and list items with a single match. Only lines whose
+            # first non-blank character is "#", "-" or a digit can be either, so
+            # other lines skip the regex and fall through to dividers and paragraphs.
+            first_char = stripped[:1]
+            if first_char == '#' or first_char == '-' or first_char.isdecimal():
+                line_match = LINE_RE.match(line)
+            else:
+                line_match = None
+            line_type = line_match.lastgroup if line_match else None
             
             # Headings
-            if line.startswith('# '):
-                blocks.append({
-                    "object": "block",
-                    "type": "heading_1",
-                    "heading_1": {
-                        "rich_text": [{"type": "text", "text": {"content": line[2:].strip()}}]
-                    }
-                })
-            elif line.startswith('## '):
-                blocks.append({
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [{"type": "text", "text": {"content": line[3:].strip()}}]
-                    }
-                })
-            elif line.startswith('### '):
-                blocks.append({
-                    "object": "block",
-                    "type": "heading_3",
-                    "heading_3": {
-                        "rich_text": [{"type": "text", "text": {"content": line[4:].strip()}}]
-                    }
-                })
+            if line_type == "heading_1":
+                add_block(text_block("heading_1", plain_text(line[2:].strip())))
+            elif line_type == "heading_2":
+                add_block(text_block("heading_2", plain_text(line[3:].strip())))
+            elif line_type == "heading_3":
+                add_block(text_block("heading_3", plain_text(line[4:].strip())))
                 
             # Horizontal rule
-            elif line.strip() == '---' or line.strip() == '***' or line.strip() == '___':
-                blocks.append({
+            elif stripped in ('---', '***', '___'):
+                add_block({
                     "object": "block",
                     "type": "divider",
                     "divider": {}
                 })
                 
             # Task list items
-            elif re.match(r'^(\s*)- \[([ x])\] ', line):
+            elif line_type == "to_do":
                 # Get indentation level and content
-                match = re.match(r'^(\s*)- \[([ x])\] (.*)', line)
-                indentation = match.group(1)
-                indent_level = len(indentation) // 2  # Assuming 2 spaces per level
-                checked = match.group(2) == 'x'
-                content = match.group(3)
+                indent_level = len(line_match.group("todo_indent")) // 2  # Assuming 2 spaces per level
+                checked = line_match.group("checked") == 'x'
+                content = line_match.group("todo_content")
                 
                 rich_text = self.process_inline_formatting(content)
-                todo_block = {
-                    "object": "block",
-                    "type": "to_do",
-                    "to_do": {
-                        "rich_text": rich_text if rich_text else [{"type": "text", "text": {"content": content}}],
-                        "checked": checked
-                    }
-                }
+                todo_block = text_block("to_do", rich_text or plain_text(content), checked=checked)
                 
                 # Handle indentation (nesting)
                 self._add_block_with_nesting(blocks, todo_block, indent_level)
             
             # Bullet list items
-            elif re.match(r'^(\s*)- ', line) and not re.match(r'^(\s*)- \[([ x])\] ', line):
+            elif line_type == "bulleted_list_item":
                 # Get indentation level and content
-                match = re.match(r'^(\s*)- (.*)', line)
-                indentation = match.group(1)
-                indent_level = len(indentation) // 2  # Assuming 2 spaces per level
-                content = match.group(2)
+                indent_level = len(line_match.group("bullet_indent")) // 2  # Assuming 2 spaces per level
+                content = line_match.group("bullet_content")
                 
                 rich_text = self.process_inline_formatting(content)
-                bullet_block = {
-                    "object": "block",
-                    "type": "bulleted_list_item",
-                    "bulleted_list_item": {
-                        "rich_text": rich_text if rich_text else [{"type": "text", "text": {"content": content}}]
-                    }
-                }
+                bullet_block = text_block("bulleted_list_item", rich_text or plain_text(content))
                 
                 # Handle indentation (nesting)
                 self._add_block_with_nesting(blocks, bullet_block, indent_level)
             
             # Numbered list items
-            elif re.match(r'^(\s*)\d+\.\s', line):
+            elif line_type == "numbered_list_item":
                 # Get indentation level and content
-                match = re.match(r'^(\s*)\d+\.\s(.*)', line)
-                indentation = match.group(1)
-                indent_level = len(indentation) // 2  # Assuming 2 spaces per level
-                content = match.group(2)
+                indent_level = len(line_match.group("number_indent")) // 2  # Assuming 2 spaces per level
+                content = line_match.group("number_content")
                 
                 rich_text = self.process_inline_formatting(content)
-                numbered_block = {
-                    "object": "block",
-                    "type": "numbered_list_item",
-                    "numbered_list_item": {
-                        "rich_text": rich_text if rich_text else [{"type": "text", "text": {"content": content}}]
-                    }
-                }
+                numbered_block = text_block("numbered_list_item", rich_text or plain_text(content))
                 
                 # Handle indentation (nesting)
                 self._add_block_with_nesting(blocks, numbered_block, indent_level)
             
             # Paragraph
-            elif line.strip():
-                rich_text = self.process_inline_formatting(line.strip())
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": rich_text if rich_text else [{"type": "text", "text": {"content": line.strip()}}]
-                    }
-                })
+            elif stripped:
+                rich_text = self.process_inline_formatting(stripped)
+                add_block(text_block("paragraph", rich_text or plain_text(stripped)))
             
             i += 1
         
         # Handle any remaining blocks
         if in_blockquote:
-            blocks.append({
-                "object": "block",
-                "type": "quote",
-                "quote": {
-                    "rich_text": [{"type": "text", "text": {"content": blockquote_content.strip()}}]
-                }
-            })
+            add_block(text_block("quote", plain_text("\n".join(blockquote_lines).strip())))
         
         if in_code_block:
-            blocks.append({
-                "object": "block",
-                "type": "code",
-                "code": {
-                    "rich_text": [{"type": "text", "text": {"content": code_block_content.rstrip()}}],
-                    "language": code_language if code_language else "plain text"
-                }
-            })
+            add_block(text_block(
+                "code",
+                plain_text("\n".join(code_block_lines).rstrip()),
+                language=code_language if code_language else "plain text"
+            ))
             
         if in_callout:
-            blocks.append({
-                "object": "block",
-                "type": "callout",
-                "callout": {
-                    "rich_text": [{"type": "text", "text": {"content": callout_content.strip()}}],
-                    "icon": {
-                        "type": "emoji",
-                        "emoji": callout_emoji
-                    },
-                    "color": "gray_background"
-                }
-            })
+            add_block(text_block(
+                "callout",
+                plain_text("\n".join(callout_lines).strip()),
+                icon={"type": "emoji", "emoji": callout_emoji},
+                color="gray_background"
+            ))
             
         return blocks
     
     def process_inline_formatting(self, text):
         """Process inline formatting in text"""
-        # Regex patterns for inline formatting
-        bold_pattern = r'\*\*(.*?)\*\*'
-        italic_pattern = r'\*(.*?)\*'
-        code_pattern = r'`(.*?)`'
-        link_pattern = r'\[(.*?)\]\((.*?)\)'
-        strikethrough_pattern = r'~~(.*?)~~'
-        
-        # Find all formatting patterns in the text
-        rich_text = []
-        remaining_text = text
-        
-        # Process bold text
-        bold_matches = list(re.finditer(bold_pattern, text))
-        # Process italic text
-        italic_matches = list(re.finditer(italic_pattern, text))
-        # Process code
-        code_matches = list(re.finditer(code_pattern, text))
-        # Process links
-        link_matches = list(re.finditer(link_pattern, text))
-        # Process strikethrough
-        strikethrough_matches = list(re.finditer(strikethrough_pattern, text))
-        
-        # Combine all matches and sort by position
-        all_matches = []
-        
-        for match in bold_matches:
-            all_matches.append({
-                'start': match.start(),
-                'end': match.end(),
-                'content': match.group(1),
-                'type': 'bold'
-            })
-        
-        for match in italic_matches:
-            # Skip matches that are part of bold formatting (** has * inside it)
-            is_inside_bold = False
-            for bold_match in bold_matches:
-                if bold_match.start() <= match.start() and bold_match.end() >= match.end():
-                    is_inside_bold = True
-                    break
-            if not is_inside_bold:
-                all_matches.append({
-                    'start': match.start(),
-                    'end': match.end(),
-                    'content': match.group(1),
-                    'type': 'italic'
-                })
-        
-        for match in code_matches:
-            all_matches.append({
-                'start': match.start(),
-                'end': match.end(),
-                'content': match.group(1),
-                'type': 'code'
-            })
-        
-        for match in link_matches:
-            all_matches.append({
-                'start': match.start(),
-                'end': match.end(),
-                'content': match.group(1),
-                'url': match.group(2),
-                'type': 'link'
-            })
-        
-        for match in strikethrough_matches:
-            all_matches.append({
-                'start': match.start(),
-                'end': match.end(),
-                'content': match.group(1),
-                'type': 'strikethrough'
-            })
-        
-        # Sort matches by start position
-        all_matches.sort(key=lambda x: x['start'])
-        
-        # If no formatting, return simple text
-        if not all_matches:
-            return [{"type": "text", "text": {"content": text}}]
-        
-        # Build rich text array
         rich_text = []
         last_end = 0
         
-        for match in all_matches:
+        for match in INLINE_RE.finditer(text):
             # Add any text before this match
-            if match['start'] > last_end:
+            if match.start() > last_end:
                 rich_text.append({
                     "type": "text",
-                    "text": {"content": text[last_end:match['start']]}
+                    "text": {"content": text[last_end:match.start()]}
                 })
             
             # Add the formatted text
-            if match['type'] == 'bold':
-                rich_text.append({
-                    "type": "text",
-                    "text": {"content": match['content']},
-                    "annotations": {"bold": True}
-                })
-            elif match['type'] == 'italic':
-                rich_text.append({
-                    "type": "text",
-                    "text": {"content": match['content']},
-                    "annotations": {"italic": True}
-                })
-            elif match['type'] == 'code':
-                rich_text.append({
-                    "type": "text",
-                    "text": {"content": match['content']},
-                    "annotations": {"code": True}
-                })
-            elif match['type'] == 'strikethrough':
+            format_type = match.lastgroup
+            if format_type == 'link':
                 rich_text.append({
                     "type": "text",
-                    "text": {"content": match['content']},
-                    "annotations": {"strikethrough": True}
+                    "text": {
+                        "content": match.group('link_content'),
+                        "link": {"url": match.group('link_url')}
+                    }
                 })
-            elif match['type'] == 'link':
+            else:
                 rich_text.append({
                     "type": "text",
-                    "text": {
-                        "content": match['content'],
-                        "link": {"url": match['url']}
-                    }
+                    "text": {"content": match.group(f'{format_type}_content')},
+                    "annotations": {format_type: True}
                 })
             
-            last_end = match['end']
+            last_end = match.end()
+        
+        # If no formatting, return simple text
+        if not rich_text:
+            return plain_text(text)
         
         # Add any remaining text
         if last_end < len(text):
@@ -587,60 +478,76 @@ class MarkdownConverter:
     def notion_blocks_to_markdown(self, blocks):
         """Convert Notion blocks to Markdown content"""
         markdown_lines = []
+        self._write_blocks_markdown(blocks, markdown_lines)
+        return "\n".join(markdown_lines)
+    
+    def _write_blocks_markdown(self, blocks, markdown_lines, indent=""):
+        """
+        Append the Markdown lines for Notion blocks to a shared list
+        
+        Args:
+            blocks: The Notion blocks to convert
+            markdown_lines: The list the Markdown lines are appended to
+            indent: Prefix for every line written, used for nested child blocks
+        """
+        def add_line(line):
+            if indent:
+                line = indent + line.replace("\n", "\n" + indent)
+            markdown_lines.append(line)
         
         for block in blocks:
             block_type = block.get("type", "")
             
             if block_type == "paragraph":
                 text = self.extract_text_from_rich_text(block["paragraph"]["rich_text"])
-                markdown_lines.append(text)
-                markdown_lines.append("")  # Add empty line after paragraph
+                add_line(text)
+                add_line("")  # Add empty line after paragraph
                 
             elif block_type == "heading_1":
                 text = self.extract_text_from_rich_text(block["heading_1"]["rich_text"])
-                markdown_lines.append(f"# {text}")
-                markdown_lines.append("")  # Add empty line after heading
+                add_line(f"# {text}")
+                add_line("")  # Add empty line after heading
                 
             elif block_type == "heading_2":
                 text = self.extract_text_from_rich_text(block["heading_2"]["rich_text"])
-                markdown_lines.append(f"## {text}")
-                markdown_lines.append("")  # Add empty line after heading
+                add_line(f"## {text}")
+                add_line("")  # Add empty line after heading
                 
             elif block_type == "heading_3":
                 text = self.extract_text_from_rich_text(block["heading_3"]["rich_text"])
-                markdown_lines.append(f"### {text}")
-                markdown_lines.append("")  # Add empty line after heading
+                add_line(f"### {text}")
+                add_line("")  # Add empty line after heading
                 
             elif block_type == "bulleted_list_item":
                 text = self.extract_text_from_rich_text(block["bulleted_list_item"]["rich_text"])
-                markdown_lines.append(f"- {text}")
+                add_line(f"- {text}")
                 
             elif block_type == "numbered_list_item":
                 text = self.extract_text_from_rich_text(block["numbered_list_item"]["rich_text"])
-                markdown_lines.append(f"1. {text}")  # We always use 1. as the number
+                add_line(f"1. {text}")  # We always use 1. as the number
                 
             elif block_type == "code":
                 text = self.extract_text_from_rich_text(block["code"]["rich_text"])
                 language = block["code"].get("language", "")
-                markdown_lines.append(f"```{language}")
-                markdown_lines.append(text)
-                markdown_lines.append("```")
-                markdown_lines.append("")  # Add empty line after code block
+                add_line(f"```{language}")
+                add_line(text)
+                add_line("```")
+                add_line("")  # Add empty line after code block
                 
             elif block_type == "to_do":
                 text = self.extract_text_from_rich_text(block["to_do"]["rich_text"])
                 checked = block["to_do"].get("checked", False)
                 checkbox = "[x]" if checked else "[ ]"
-                markdown_lines.append(f"- {checkbox} {text}")
+                add_line(f"- {checkbox} {text}")
                 
             elif block_type == "quote":
                 text = self.extract_text_from_rich_text(block["quote"]["rich_text"])
-                markdown_lines.append(f"> {text}")
-                markdown_lines.append("")  # Add empty line after quote
+                add_line(f"> {text}")
+                add_line("")  # Add empty line after quote
                 
             elif block_type == "divider":
-                markdown_lines.append("---")
-                markdown_lines.append("")  # Add empty line after divider
+                add_line("---")
+                add_line("")  # Add empty line after divider
                 
             elif block_type == "callout":
                 text = self.extract_text_from_rich_text(block["callout"]["rich_text"])
@@ -649,17 +556,17 @@ class MarkdownConverter:
                     emoji = block["callout"]["icon"]["emoji"]
                 
                 # Use a special syntax for callouts
-                markdown_lines.append(f"::: callout {emoji}")
-                markdown_lines.append(f"    {text}")
-                markdown_lines.append(":::")
-                markdown_lines.append("")  # Add empty line after callout
+                add_line(f"::: callout {emoji}")
+                add_line(f"    {text}")
+                add_line(":::")
+                add_line("")  # Add empty line after callout
                 
             elif block_type == "child_page":
                 # Handle child page blocks
                 page_title = block["child_page"].get("title", "Untitled")
                 # Create a link to the child page
-                markdown_lines.append(f"[📄 {page_title}]({page_title}.md)")
-                markdown_lines.append("")  # Add empty line after child page reference
+                add_line(f"[📄 {page_title}]({page_title}.md)")
+                add_line("")  # Add empty line after child page reference
                 
             elif block_type == "table":
                 table_rows = []
@@ -693,18 +600,19 @@ class MarkdownConverter:
                                 table_rows.append("| " + " | ".join(header_sep) + " |")
                 
                 # Add table rows to markdown
-                markdown_lines.extend(table_rows)
-                markdown_lines.append("")  # Add empty line after table
+                for table_row in table_rows:
+                    add_line(table_row)
+                add_line("")  # Add empty line after table
                 
             # Handle child blocks recursively if available
             if "children" in block and block["children"] and block_type != "table":
                 # For table, children are already processed as rows
-                child_markdown = self.notion_blocks_to_markdown(block["children"])
-                # Indent child content
-                indented_markdown = "\n".join(["    " + line for line in child_markdown.split("\n")])
-                markdown_lines.append(indented_markdown)
-        
-        return "\n".join(markdown_lines)
+                # Write child content straight into the shared list, one level deeper
+                child_start = len(markdown_lines)
+                self._write_blocks_markdown(block["children"], markdown_lines, indent + "    ")
+                if len(markdown_lines) == child_start:
+                    # Children without any content still leave an indented blank line
+                    markdown_lines.append(indent + "    ")
     
     def extract_text_from_rich_text(self, rich_text):
         """Extract plain text from Notion rich text array"""
@@ -715,18 +623,11 @@ class MarkdownConverter:
             annotations = text_item.get("annotations", {})
             link = text_item.get("text", {}).get("link", None)
             
-            # Apply formatting based on annotations
-            if annotations.get("bold"):
-                content = f"**{content}**"
-            if annotations.get("italic"):
-                content = f"*{content}*"
-            if annotations.get("strikethrough"):
-                content = f"~~{content}~~"
-            if annotations.get("code"):
-                content = f"`{content}`"
-            if annotations.get("underline"):
-                # Markdown doesn't have underline, approximate with emphasis
-                content = f"_{content}_"
+            # Apply formatting based on annotations, wrapping the content once
+            if annotations:
+                markers = [marker for name, marker in ANNOTATION_MARKERS if annotations.get(name)]
+                if markers:
+                    content = "".join(reversed(markers)) + content + "".join(markers)
                 
             # Handle links
             if link and link.get("url"):
@@ -4,6 +4,6 @@ NotionSync Utils Module
 This module provides utility functions for NotionSync.
 """
 
-from .helpers import load_env_variables, extract_front_matter, get_file_changes
+from .helpers import load_env_variables, extract_front_matter, get_file_changes, read_json, write_json, write_file_atomic, hash_content, hash_file
 
-__all__ = ["load_env_variables", "extract_front_matter", "get_file_changes"] 
\ No newline at end of file
+__all__ = ["load_env_variables", "extract_front_matter", "get_file_changes", "read_json", "write_json", "write_file_atomic", "hash_content", "hash_file"] 
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+NotionSync - Console Output
+
+This module provides the shared rich console used for CLI output.
+"""
+
+import sys
+
+_console = None
+
+def get_console():
+    """Get the shared rich Console, creating it on first use
+    
+    Colors are disabled when stdout is not a terminal, e.g. when piped.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console(no_color=not sys.stdout.isatty())
+    return _console
+
+class LazyConsole:
+    """Stand-in for a rich Console that defers creating it until it is used"""
+    
+    def __getattr__(self, name):
+        return getattr(get_console(), name)
+
+# Initialize rich console for better output formatting
+console = LazyConsole()
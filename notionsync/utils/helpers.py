@@ -6,12 +6,44 @@ This module provides utility functions for NotionSync.
 
 import os
 import re
+import json
+import mmap
+import hashlib
+import tempfile
 from pathlib import Path
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv, find_dotenv
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files at least this large are hashed through mmap rather than read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+# Maximum number of files hashed at once; hashlib releases the GIL while hashing
+MAX_HASH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Permissions for new files, as open() would create them under the process umask
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+NEW_FILE_MODE = 0o666 & ~_UMASK
+
+# .env files already loaded into the environment, as (path, mtime_ns) pairs
+_loaded_dotenv_files = set()
 
 def load_env_variables():
-    """Load environment variables from .env file"""
-    load_dotenv()
+    """Load environment variables from .env file
+    
+    The .env file is only parsed again when it has changed since it was last loaded.
+    """
+    dotenv_path = find_dotenv()
+    if dotenv_path:
+        dotenv_key = (dotenv_path, os.stat(dotenv_path).st_mtime_ns)
+        if dotenv_key not in _loaded_dotenv_files:
+            load_dotenv(dotenv_path)
+            _loaded_dotenv_files.add(dotenv_key)
     
     # Get Notion API configuration
     api_key = os.getenv("NOTION_API_KEY")
@@ -47,6 +79,80 @@ def load_env_variables():
         "database_id": database_id
     }
 
+def read_json(path):
+    """Read a JSON file, using orjson when it is installed"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_json(path, data, indent=False, atomic=False, fsync=False):
+    """
+    Write data to a JSON file, using orjson when it is installed
+    
+    Args:
+        path: The file to write
+        data: JSON-serializable data
+        indent: Pretty-print with two-space indentation
+        atomic: Write through a temporary file and rename, see write_file_atomic
+        fsync: With atomic, flush the data to disk before the rename
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        encoded = json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+    
+    if atomic:
+        write_file_atomic(path, encoded, fsync)
+    else:
+        with open(path, "wb") as f:
+            f.write(encoded)
+
+def write_file_atomic(path, data, fsync=False):
+    """
+    Write bytes to a file so that readers never see a partial file
+    
+    The data is written to a temporary file next to the target in a single
+    write, which is then renamed over the target. The temporary file gets a
+    unique name, so concurrent writes of the same file, from other threads or
+    other processes, cannot collide.
+    
+    Args:
+        path: The file to write
+        data: The file content as bytes
+        fsync: Flush the data to disk before the rename, so it survives a crash
+    """
+    directory, name = os.path.split(os.fspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{name}.", suffix=".tmp", dir=directory or ".")
+    try:
+        with open(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        # mkstemp creates the file private to the user; give it the usual permissions
+        os.chmod(tmp_path, NEW_FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def hash_content(data):
+    """Get the content hash of file data as a hex string"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def hash_file(path):
+    """Get the content hash of a file"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return hash_content(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hash_content(mapped)
+
 def extract_front_matter(markdown_content):
     """Extract front matter from markdown content"""
     front_matter = {}
@@ -71,8 +177,15 @@ def extract_front_matter(markdown_content):
     
     return front_matter, content
 
-def get_file_changes(last_commit_files, current_files):
-    """Get changes between the last commit and current files"""
+def get_file_changes(last_commit_files, current_files, unchanged=()):
+    """
+    Get changes between the last commit and current files
+    
+    Args:
+        last_commit_files: Dict mapping committed file paths to their content hash
+        current_files: Paths of the current markdown files
+        unchanged: Paths already known to match the last commit, which are not read
+    """
     changes = {
         "added": [],
         "modified": [],
@@ -82,17 +195,20 @@ def get_file_changes(last_commit_files, current_files):
     # Convert current files to a dictionary for easier comparison
     current_files_dict = {str(f): f for f in current_files}
     
-    # Find added and modified files
+    # Find added files and the files whose content needs checking
+    to_check = []
     for file_path in current_files_dict:
         if file_path not in last_commit_files:
             changes["added"].append(file_path)
-        else:
-            # Check if content has changed
-            with open(file_path, "r", encoding="utf-8") as f:
-                current_content = f.read()
-            
-            if current_content != last_commit_files[file_path]:
-                changes["modified"].append(file_path)
+        elif file_path not in unchanged:
+            to_check.append(file_path)
+    
+    # Check if content has changed, hashing files in parallel
+    if to_check:
+        with ThreadPoolExecutor(max_workers=MAX_HASH_WORKERS) as executor:
+            for file_path, file_hash in zip(to_check, executor.map(hash_file, to_check)):
+                if file_hash != last_commit_files[file_path]:
+                    changes["modified"].append(file_path)
     
     # Find deleted files
     for file_path in last_commit_files:
@@ -21,9 +21,11 @@ setup(
         "notion-client>=1.0.0",
         "requests>=2.26.0",
         "rich>=10.0.0",
-        "mistune>=2.0.0",
-        "mistletoe>=0.7.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0.0"],
+        "zstd": ["zstandard>=0.20"],
+    },
     entry_points={
         "console_scripts": [
             "notionsync=notionsync.cli.commands:main",
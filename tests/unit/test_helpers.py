@@ -0,0 +1,34 @@
+"""
+NotionSync - Helper Unit Tests
+
+This module tests the file helpers used by the local store.
+"""
+
+import os
+import pytest
+
+from notionsync.utils.helpers import write_file_atomic
+
+pytestmark = pytest.mark.unit
+
+class TestWriteFileAtomic:
+    """Test atomic file writes"""
+    
+    def test_replaces_file(self, tmp_path):
+        target = tmp_path / "config.json"
+        target.write_bytes(b"old")
+        
+        write_file_atomic(target, b"new", fsync=True)
+        
+        assert target.read_bytes() == b"new"
+        assert os.listdir(tmp_path) == ["config.json"]
+    
+    def test_removes_temporary_file_on_error(self, tmp_path):
+        target = tmp_path / "config.json"
+        target.write_bytes(b"old")
+        
+        with pytest.raises(TypeError):
+            write_file_atomic(target, "not bytes")
+        
+        assert target.read_bytes() == b"old"
+        assert os.listdir(tmp_path) == ["config.json"]
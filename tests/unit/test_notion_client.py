@@ -0,0 +1,105 @@
+"""
+NotionSync - Notion API Client Unit Tests
+
+This module tests the retry behaviour of the Notion API client without
+making network requests.
+"""
+
+import pytest
+
+from notionsync.core import notion_client
+from notionsync.core.notion_client import NotionApiClient, MAX_RETRIES
+
+pytestmark = pytest.mark.unit
+
+class FakeApiError(Exception):
+    """An API error carrying an HTTP status, like notion_client's APIResponseError"""
+    
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.headers = headers or {}
+
+class FlakyCall:
+    """An API function that raises the given errors in turn, then returns "ok" """
+    
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+    
+    def __call__(self, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff sleeps instead of waiting"""
+    recorded = []
+    monkeypatch.setattr(notion_client.time, "sleep", recorded.append)
+    return recorded
+
+@pytest.fixture
+def client():
+    """A client whose HTTP client is never used"""
+    return NotionApiClient(api_key="test_api_key")
+
+class TestCallWithBackoff:
+    """Test which failures _call_with_backoff retries"""
+    
+    def test_success_is_not_retried(self, client, sleeps):
+        call = FlakyCall()
+        
+        assert client._call_with_backoff(call, page_id="p") == "ok"
+        assert call.calls == 1
+        assert sleeps == []
+    
+    def test_rate_limit_waits_for_retry_after(self, client, sleeps):
+        call = FlakyCall(FakeApiError(429, {"retry-after": "7"}))
+        
+        assert client._call_with_backoff(call) == "ok"
+        assert call.calls == 2
+        assert sleeps == [7.0]
+    
+    def test_rate_limit_is_retried_for_creates(self, client, sleeps):
+        call = FlakyCall(FakeApiError(429), FakeApiError(429))
+        
+        assert client._call_with_backoff(call, idempotent=False) == "ok"
+        assert call.calls == 3
+        assert len(sleeps) == 2
+    
+    def test_server_error_is_retried_for_idempotent_calls(self, client, sleeps):
+        call = FlakyCall(FakeApiError(503), FakeApiError(502))
+        
+        assert client._call_with_backoff(call) == "ok"
+        assert call.calls == 3
+    
+    @pytest.mark.parametrize("status", [500, 502, 503, 504])
+    def test_server_error_is_not_retried_for_creates(self, client, sleeps, status):
+        call = FlakyCall(FakeApiError(status))
+        
+        with pytest.raises(FakeApiError):
+            client._call_with_backoff(call, idempotent=False)
+        assert call.calls == 1
+        assert sleeps == []
+    
+    def test_client_error_is_not_retried(self, client, sleeps):
+        call = FlakyCall(FakeApiError(400))
+        
+        with pytest.raises(FakeApiError):
+            client._call_with_backoff(call)
+        assert call.calls == 1
+    
+    def test_gives_up_after_max_retries(self, client, sleeps):
+        call = FlakyCall(*(FakeApiError(429) for _ in range(MAX_RETRIES)))
+        
+        with pytest.raises(FakeApiError):
+            client._call_with_backoff(call)
+        assert call.calls == MAX_RETRIES
+        assert len(sleeps) == MAX_RETRIES - 1
+    
+    def test_underlying_client_does_not_retry(self, client):
+        # Retries of notion-client itself would multiply with _call_with_backoff's
+        options = client.client.options
+        assert getattr(options, "retry", False) is False
@@ -0,0 +1,269 @@
+"""
+NotionSync - Sync Unit Tests
+
+This module tests local commit storage, status and file discovery without
+calling the Notion API.
+"""
+
+import os
+import pytest
+from pathlib import Path
+
+from notionsync.core import sync as sync_module
+from notionsync.core.sync import NotionSync
+from notionsync.utils.helpers import read_json, write_json
+
+pytestmark = pytest.mark.unit
+
+@pytest.fixture
+def sync(tmp_path, monkeypatch):
+    """A NotionSync working in an empty directory, with its own config directory"""
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    monkeypatch.chdir(work_dir)
+    return NotionSync(api_key="test_api_key", config_dir=tmp_path / "config")
+
+def bump_mtime(path):
+    """Move a file's mtime forward, so the change shows even on coarse filesystem clocks"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+class TestCommitAndStatus:
+    """Test commits to the object store and status against them"""
+    
+    def test_status_before_first_commit(self, sync):
+        Path("index.md").write_text("# Index\n")
+        
+        status = sync.status()
+        
+        assert status["no_commits"] is True
+        assert status["all_files"] == ["index.md"]
+    
+    def test_commit_stores_manifest_and_objects(self, sync):
+        Path("index.md").write_text("# Index\n")
+        Path("copy.md").write_text("# Index\n")
+        
+        commit_data = sync.commit("first")
+        
+        files = {file_data["path"]: file_data for file_data in commit_data["files"]}
+        assert set(files) == {"index.md", "copy.md"}
+        assert all("content" not in file_data for file_data in files.values())
+        # Identical content is stored once
+        assert files["index.md"]["hash"] == files["copy.md"]["hash"]
+        assert len(os.listdir(sync.config_dir / "objects")) == 1
+        assert sync.read_file_content(files["index.md"]) == "# Index\n"
+        
+        config = sync.load_config()
+        saved = sync.load_commit(sync.get_last_commit_file(config))
+        assert saved == commit_data
+    
+    def test_status_unchanged(self, sync):
+        Path("index.md").write_text("# Index\n")
+        sync.commit("first")
+        
+        status = sync.status()
+        
+        assert status["changes_since_last_commit"] is False
+        assert status["added"] == status["modified"] == status["deleted"] == []
+    
+    def test_status_touched_without_edit(self, sync):
+        Path("index.md").write_text("# Index\n")
+        sync.commit("first")
+        bump_mtime("index.md")
+        
+        assert sync.status()["changes_since_last_commit"] is False
+    
+    def test_status_modified_same_size(self, sync):
+        Path("index.md").write_text("# Index\n")
+        sync.commit("first")
+        
+        Path("index.md").write_text("# Other\n")
+        bump_mtime("index.md")
+        
+        status = sync.status()
+        
+        assert status["modified"] == ["index.md"]
+        assert status["added"] == status["deleted"] == []
+    
+    def test_status_added_and_deleted(self, sync):
+        Path("index.md").write_text("# Index\n")
+        Path("old.md").write_text("old\n")
+        sync.commit("first")
+        
+        Path("old.md").unlink()
+        Path("docs").mkdir()
+        Path("docs", "new.md").write_text("new\n")
+        
+        status = sync.status()
+        
+        assert status["added"] == [os.path.join("docs", "new.md")]
+        assert status["deleted"] == ["old.md"]
+        assert status["modified"] == []
+    
+    def test_commit_reuses_unchanged_entries(self, sync):
+        Path("index.md").write_text("# Index\n")
+        first = sync.commit("first")
+        
+        Path("other.md").write_text("other\n")
+        second = sync.commit("second")
+        
+        first_entry = first["files"][0]
+        second_entries = {file_data["path"]: file_data for file_data in second["files"]}
+        assert second_entries["index.md"] == first_entry
+        assert sync.read_file_content(second_entries["other.md"]) == "other\n"
+    
+    def test_commit_log_newest_first(self, sync):
+        Path("index.md").write_text("# Index\n")
+        sync.commit("first")
+        Path("other.md").write_text("other\n")
+        sync.commit("second")
+        
+        log = sync.get_commit_log()
+        
+        assert [commit["message"] for commit in log] == ["second", "first"]
+        assert [commit["file_count"] for commit in log] == [2, 1]
+        assert [commit["message"] for commit in sync.get_commit_log(limit=1)] == ["second"]
+        assert (sync.config_dir / "commit_index.json").exists()
+
+class TestObjectStore:
+    """Test content objects, with and without zstd compression"""
+    
+    def test_uncompressed_round_trip(self, sync, monkeypatch):
+        monkeypatch.setattr(sync_module, "zstandard", None)
+        
+        content_hash = sync.write_object("# Índex\n".encode("utf-8"))
+        
+        assert sync.find_object(content_hash).name == content_hash
+        assert sync.read_object(content_hash) == "# Índex\n"
+    
+    def test_compressed_round_trip(self, sync):
+        pytest.importorskip("zstandard")
+        
+        content_hash = sync.write_object("# Índex\n".encode("utf-8"))
+        
+        assert sync.find_object(content_hash).name == f"{content_hash}.zst"
+        assert sync.read_object(content_hash) == "# Índex\n"
+    
+    def test_existing_object_is_not_rewritten(self, sync, monkeypatch):
+        monkeypatch.setattr(sync_module, "zstandard", None)
+        content_hash = sync.write_object(b"text")
+        
+        # A plain object stays the stored copy once zstd becomes available
+        monkeypatch.undo()
+        assert sync.write_object(b"text") == content_hash
+        assert os.listdir(sync.config_dir / "objects") == [content_hash]
+    
+    def test_compressed_object_without_zstandard(self, sync, monkeypatch):
+        monkeypatch.setattr(sync_module, "zstandard", None)
+        objects_dir = sync.config_dir / "objects"
+        objects_dir.mkdir()
+        (objects_dir / "abc.zst").write_bytes(b"compressed")
+        
+        with pytest.raises(RuntimeError, match=r"notionsync\[zstd\]"):
+            sync.read_object("abc")
+    
+    def test_missing_object(self, sync):
+        assert sync.find_object("abc") is None
+        with pytest.raises(FileNotFoundError):
+            sync.read_object("abc")
+
+class TestConfig:
+    """Test the parsed config cache"""
+    
+    def test_save_then_load(self, sync):
+        sync.save_config({"last_commit": "a"})
+        sync.save_config({"last_commit": "b", "last_commit_file": "b.json"})
+        
+        assert sync.load_config() == {"last_commit": "b", "last_commit_file": "b.json"}
+    
+    def test_rewrite_within_same_mtime_is_reloaded(self, sync):
+        sync.save_config({"last_commit": "a"})
+        assert sync.load_config() == {"last_commit": "a"}
+        
+        # Rewrite in place, keeping the mtime, as on a filesystem with coarse timestamps
+        config_file = sync.config_dir / "config.json"
+        stat = config_file.stat()
+        config_file.write_text('{"last_commit": "a", "last_commit_file": "a.json"}')
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        
+        assert sync.load_config() == {"last_commit": "a", "last_commit_file": "a.json"}
+
+class TestOldCommitFormat:
+    """Test commits written before the object store, with inline content"""
+    
+    @pytest.fixture
+    def old_commit(self, sync):
+        """Write index.md and an old-style commit of it, named after its timestamp"""
+        Path("index.md").write_text("# Index\n")
+        
+        timestamp = "2024-01-01T12:00:00.000000"
+        commits_dir = sync.config_dir / "commits"
+        commits_dir.mkdir()
+        write_json(commits_dir / f"{timestamp.replace(':', '-')}.json", {
+            "timestamp": timestamp,
+            "message": "old commit",
+            "files": [{"path": "index.md", "content": "# Index\n"}]
+        }, indent=True)
+        sync.save_config({"last_commit": timestamp})
+        return timestamp
+    
+    def test_load_old_commit(self, sync, old_commit):
+        commit_data = sync.load_commit(sync.get_last_commit_file(sync.load_config()))
+        
+        assert commit_data["timestamp"] == old_commit
+        assert sync.read_file_content(commit_data["files"][0]) == "# Index\n"
+    
+    def test_status_against_old_commit(self, sync, old_commit):
+        status = sync.status()
+        assert status["changes_since_last_commit"] is False
+        assert status["last_commit"] == old_commit
+        
+        Path("index.md").write_text("# Edited\n")
+        assert sync.status()["modified"] == ["index.md"]
+    
+    def test_commit_after_old_commit(self, sync, old_commit):
+        commit_data = sync.commit("new commit")
+        
+        file_data = commit_data["files"][0]
+        assert "content" not in file_data
+        assert sync.read_file_content(file_data) == "# Index\n"
+        assert [commit["message"] for commit in sync.get_commit_log()] == ["new commit", "old commit"]
+        assert read_json(sync.config_dir / "config.json")["last_commit_file"] != f"{old_commit.replace(':', '-')}.json"
+
+class TestWalkMarkdownFiles:
+    """Test discovery of markdown files"""
+    
+    def test_finds_nested_markdown_only(self, sync):
+        Path("a", "b").mkdir(parents=True)
+        Path("index.md").write_text("")
+        Path("a", "b", "deep.md").write_text("")
+        Path("a", "notes.txt").write_text("")
+        Path("a", "dir.md").mkdir()
+        
+        assert sorted(sync.get_markdown_files()) == sorted(["index.md", os.path.join("a", "b", "deep.md")])
+    
+    def test_does_not_follow_symlinked_directories(self, sync):
+        Path("a").mkdir()
+        Path("a", "n.md").write_text("")
+        try:
+            os.symlink("..", os.path.join("a", "loop"), target_is_directory=True)
+            os.symlink(os.path.join("a", "n.md"), "link.md")
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks are not supported here")
+        
+        assert sorted(sync.get_markdown_files()) == [os.path.join("a", "n.md"), "link.md"]
+    
+    def test_skips_unreadable_directories(self, sync, monkeypatch):
+        Path("locked").mkdir()
+        Path("locked", "secret.md").write_text("")
+        Path("index.md").write_text("")
+        
+        # Fail like a directory without read permission, which root could still read
+        scandir = os.scandir
+        def fake_scandir(path):
+            if os.path.basename(path) == "locked":
+                raise PermissionError(13, "Permission denied", path)
+            return scandir(path)
+        monkeypatch.setattr(os, "scandir", fake_scandir)
+        
+        assert sync.get_markdown_files() == ["index.md"]